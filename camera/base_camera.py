@@ -11,6 +11,8 @@ class BaseCameraManager(ABC):
     get_frame() devuelve np.ndarray uint8:
       - Mono: shape (H, W)
       - Color: shape (H, W, 3) en RGB
+    get_frame() / capture() devuelven un array nuevo en cada llamada que el
+    backend no vuelve a tocar: quien lo recibe puede guardarlo sin copiarlo.
     """
 
     def __init__(self):
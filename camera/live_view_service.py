@@ -32,4 +32,6 @@ class LiveViewService(QObject):
     def _grab_frame(self):
         frame = self.cam.get_frame()
         if frame is not None:
+            # shared by every FrameBus subscriber: read-only instead of per-subscriber copies
+            frame.flags.writeable = False
             FrameBus().frame_ready.emit(frame)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import ctypes
 import os
+import threading
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
@@ -76,6 +77,9 @@ class ZWOCameraManager(BaseCameraManager):
         self._roi = _ROI(0, 0, 0, 0, 1, ASI_IMG_RAW8)
         self._frame_buf = None  # ctypes buffer
         self._frame_bytes = 0
+        # _frame_buf is shared by every get_frame() caller (live view timer, preview
+        # and capture workers): one reader at a time, and no ROI swap mid-read
+        self._buf_lock = threading.Lock()
 
         self._gain = 100
         self._exp_us = 30000  # microsegundos
@@ -215,16 +219,17 @@ class ZWOCameraManager(BaseCameraManager):
         if was_live:
             self.stop_live()
 
-        self._roi = _ROI(x, y, w, h, 1, ASI_IMG_RAW8)
+        with self._buf_lock:
+            self._roi = _ROI(x, y, w, h, 1, ASI_IMG_RAW8)
 
-        # aplicar ROI al SDK
-        err1 = self.sdk.ASISetROIFormat(self.camera_id, self._roi.w, self._roi.h, self._roi.bin, self._roi.img_type)
-        err2 = self.sdk.ASISetStartPos(self.camera_id, self._roi.x, self._roi.y)
+            # aplicar ROI al SDK
+            err1 = self.sdk.ASISetROIFormat(self.camera_id, self._roi.w, self._roi.h, self._roi.bin, self._roi.img_type)
+            err2 = self.sdk.ASISetStartPos(self.camera_id, self._roi.x, self._roi.y)
 
-        if err1 != ASI_SUCCESS or err2 != ASI_SUCCESS:
-            print("[ZWO] set_roi error:", err1, err2)
+            if err1 != ASI_SUCCESS or err2 != ASI_SUCCESS:
+                print("[ZWO] set_roi error:", err1, err2)
 
-        self._alloc_buffer()
+            self._alloc_buffer()
 
         if was_live:
             self.start_live()
@@ -276,23 +281,27 @@ class ZWOCameraManager(BaseCameraManager):
             return None
         if not self.sdk_available or not self.camera_connected or self.camera_id is None:
             return None
-        if self._frame_buf is None:
-            return None
 
-        err = self.sdk.ASIGetVideoData(
-            self.camera_id,
-            ctypes.cast(self._frame_buf, ctypes.POINTER(ctypes.c_ubyte)),
-            ctypes.c_long(self._frame_bytes),
-            int(timeout_ms)
-        )
-        if err != ASI_SUCCESS:
-            return None
+        with self._buf_lock:
+            if self._frame_buf is None:
+                return None
+
+            err = self.sdk.ASIGetVideoData(
+                self.camera_id,
+                ctypes.cast(self._frame_buf, ctypes.POINTER(ctypes.c_ubyte)),
+                ctypes.c_long(self._frame_bytes),
+                int(timeout_ms)
+            )
+            if err != ASI_SUCCESS:
+                return None
+
+            # copiar buffer -> numpy (la copia queda fuera del buffer compartido)
+            # RAW8 -> (H, W) uint8
+            arr = np.frombuffer(bytes(self._frame_buf), dtype=np.uint8)
+            h, w = self._roi.h, self._roi.w
 
-        # copiar buffer -> numpy
-        # RAW8 -> (H, W) uint8
-        arr = np.frombuffer(bytes(self._frame_buf), dtype=np.uint8)
         try:
-            img = arr.reshape((self._roi.h, self._roi.w))
+            img = arr.reshape((h, w))
         except Exception:
             return None
 
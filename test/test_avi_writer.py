@@ -0,0 +1,48 @@
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+from utils.avi_writer import AVIStreamWriter
+
+rng = np.random.default_rng(0)
+h, w = 120, 160
+
+with tempfile.TemporaryDirectory() as d:
+    path = os.path.join(d, "t.avi")
+
+    # mono uint8 frames, encoded while writing; header rate fixed up on close
+    avi = AVIStreamWriter(path, 12)
+    for _ in range(20):
+        frame = rng.integers(0, 255, (h, w), dtype=np.uint8)
+        while not avi.write(frame):
+            pass  # test only: retry instead of dropping
+    avi.close(fps=7.5)
+    assert avi.count == 20 and not avi.failed
+
+    cap = cv2.VideoCapture(path)
+    n = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+    cap.release()
+    print("AVI:", n, "frames", fps, "fps", size)
+    assert n == 20 and abs(fps - 7.5) < 1e-3 and size == (w, h)
+
+    # owned handoff: read-only live frames are queued without a copy
+    path = os.path.join(d, "owned.avi")
+    avi = AVIStreamWriter(path, 12)
+    for _ in range(10):
+        frame = rng.integers(0, 255, (h, w, 3), dtype=np.uint8)
+        frame.flags.writeable = False
+        while not avi.write(frame, owned=True):
+            pass
+    avi.close()
+
+    cap = cv2.VideoCapture(path)
+    n = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    print("AVI (owned):", n, "frames")
+    assert n == 10
+
+print("OK")
@@ -0,0 +1,31 @@
+import numpy as np
+
+from ui.polar_alignment_page import _centroid_brightest, _coarse_peak_xy, _locate_polaris
+
+rng = np.random.default_rng(0)
+h, w = 720, 1280
+
+# 1 px star between the coarse grid samples vs a dimmer pixel on the grid
+frame = np.zeros((h, w), dtype=np.uint8)
+frame[401, 403] = 250
+frame[600, 900] = 60
+print("Pico (full frame):", _coarse_peak_xy(frame))
+assert _coarse_peak_xy(frame) == (403, 401)
+
+# same star, found through a seeded ROI (radius >= 60 uses the coarse pass)
+noisy = rng.normal(30, 4, (h, w)).clip(0, 255).astype(np.uint8)
+noisy[401, 403] = 250
+p = _centroid_brightest(noisy, seed=(420.0, 420.0), search_radius=140)
+print("Pico (ROI con semilla):", p)
+assert p is not None and abs(p[0] - 403) < 0.5 and abs(p[1] - 401) < 0.5
+
+# Polaris far from the seed: noise-only ROIs are rejected, search widens
+yy, xx = np.mgrid[0:h, 0:w]
+star = 200.0 * np.exp(-((xx - 100) ** 2 + (yy - 100) ** 2) / 4.5)
+sky = np.maximum(rng.normal(30, 4, (h, w)).clip(0, 255), star).astype(np.uint8)
+assert _centroid_brightest(sky, seed=(w / 2, h / 2), search_radius=140) is None
+p = _locate_polaris(sky, (None, None, None, (w / 2, h / 2)))
+print("Polaris (semilla lejana):", p)
+assert p is not None and abs(p[0] - 100) < 0.5 and abs(p[1] - 100) < 0.5
+
+print("OK")
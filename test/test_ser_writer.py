@@ -0,0 +1,32 @@
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from utils.ser_writer import SERWriter
+
+w, h, n = 64, 48, 5
+path = os.path.join(tempfile.mkdtemp(), "test.ser")
+
+writer = SERWriter(path=path, width=w, height=h, bit_depth=8, fps=30.0)
+frames = [np.full((h, w), i * 10, dtype=np.uint8) for i in range(n)]
+for f in frames:
+    writer.write(f)
+writer.close()
+
+with open(path, "rb") as fp:
+    data = fp.read()
+
+file_id, lu_id, color_id, endian, width, height, depth, count = struct.unpack_from("<14s7i", data, 0)
+print("Header:", file_id, width, height, depth, count)
+assert file_id == b"LUCAM-RECORDER"
+assert (width, height, depth, count) == (w, h, 8, n)
+
+# 178-byte header + raw frames + one u64 timestamp per frame
+assert len(data) == 178 + n * w * h + n * 8
+for i, f in enumerate(frames):
+    off = 178 + i * w * h
+    assert data[off : off + w * h] == f.tobytes()
+
+print("OK")
@@ -15,17 +15,18 @@ from datetime import datetime
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
-import cv2
 import numpy as np
 
-from PySide6.QtCore import Qt, QObject, Signal, QTimer, QRect, QSize, QPoint, QThread
-from PySide6.QtGui import QColor, QFont, QImage, QPainter, QPen, QPixmap
+from PySide6.QtCore import Qt, QObject, Signal, QTimer, QRect, QSize, QPoint, QPointF
+from PySide6.QtGui import QColor, QFont, QFontMetricsF, QImage, QPainter, QPen, QPixmap, QStaticText
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
     QSpinBox, QDoubleSpinBox, QCheckBox, QSlider, QSplitter,
     QSizePolicy, QMessageBox, QGroupBox, QGridLayout
 )
 
+from utils.avi_writer import AVIStreamWriter
+
 try:
     from camera.zwo_camera import ZWOCameraManager
 except Exception:
@@ -84,7 +85,8 @@ class SimulatedCameraManager:
         self._roi = None
         self._w = 1280
         self._h = 720
-        
+        self._rng = np.random.default_rng()
+
 
     def start_live(self): return True
     def stop_live(self): return True
@@ -94,7 +96,10 @@ class SimulatedCameraManager:
 
     def get_frame(self):
         w, h = self._w, self._h
-        img = np.random.normal(10, 6, (h, w)).astype(np.float32)
+        # sky noise: uniform 0..20 (mean 10, sigma ~6) drawn straight as float32
+        # (no Box-Muller, no float64 -> float32 cast)
+        img = self._rng.random((h, w), dtype=np.float32)
+        img *= 20.0
 
         xs = np.random.randint(0, w, 250)
         ys = np.random.randint(0, h, 250)
@@ -133,13 +138,15 @@ class LiveViewService(QObject):
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._tick)
         self._running = False
+        self.fps = 12
 
     def start(self, fps=12):
         if self._running:
             return True
         self._running = True
+        self.fps = max(1, min(60, int(fps)))
         self.cam.start_live()
-        self.timer.start(int(1000 / max(1, min(60, int(fps)))))
+        self.timer.start(int(1000 / self.fps))
         return True
 
     def stop(self):
@@ -154,6 +161,9 @@ class LiveViewService(QObject):
         try:
             frame = self.cam.get_frame()
             if frame is not None:
+                # every subscriber (view, histogram, projector, bus…) shares this one
+                # array: read-only, so none of them needs a defensive copy
+                frame.flags.writeable = False
                 self.frame_ready.emit(frame)
         except Exception:
             pass
@@ -186,73 +196,6 @@ class CaptureWorker(QObject):
         except Exception as e:
             self.error.emit(str(e))
 
-# ─────────────────────────────────────────────
-# VideoCaptureWorker para capturar largas exposiciones
-# ─────────────────────────────────────────────
-
-class VideoCaptureWorker(QObject):
-    finished = Signal(list)
-    error = Signal(str)
-
-    def __init__(self, duration_s: float):
-        super().__init__()
-        self.duration_s = duration_s
-        self._frames = []
-        self._running = True
-
-    def push_frame(self, frame: np.ndarray):
-        if self._running:
-            self._frames.append(frame.copy())
-
-    def run(self):
-        try:
-            t0 = time.time()
-            while time.time() - t0 < self.duration_s:
-                time.sleep(0.01)
-            self._running = False
-            self.finished.emit(self._frames)
-        except Exception as e:
-            self.error.emit(str(e))
-
-# ─────────────────────────────────────────────
-# AVISaveWorker para guardar los videos
-# ─────────────────────────────────────────────          
-
-class AviSaveWorker(QObject):
-    finished = Signal()
-    error = Signal(str)
-
-    def __init__(self, frames, path, fps):
-        super().__init__()
-        self.frames = frames
-        self.path = path
-        self.fps = fps
-
-    def run(self):
-        try:
-            h, w = self.frames[0].shape[:2]
-            writer = cv2.VideoWriter(
-                self.path,
-                cv2.VideoWriter_fourcc(*"MJPG"),
-                self.fps,
-                (w, h),
-                True
-            )
-
-            if not writer.isOpened():
-                raise RuntimeError("No se pudo abrir el writer AVI")
-
-            for f in self.frames:
-                if f.ndim == 2:
-                    f = cv2.cvtColor(f, cv2.COLOR_GRAY2BGR)
-                writer.write(f)
-
-            writer.release()
-            self.finished.emit()
-
-        except Exception as e:
-            self.error.emit(str(e))
-
 
 # ─────────────────────────────────────────────
 # LiveView Widget (pinta frame + overlay + zoom + pan)
@@ -293,6 +236,14 @@ class LiveViewWidget(QWidget):
         self._fps = 0.0
         self._fps_counter = 0
 
+        # HUD text: font + laid-out lines kept across paints (re-shaped only when the text changes)
+        self._hud_font = QFont("Segoe UI", 10, QFont.Bold)
+        self._hud_ascent = QFontMetricsF(self._hud_font).ascent()
+        self._hud_info = QStaticText()
+        self._hud_capture = QStaticText("LIVE (preview) — Capturando exposición dedicada")
+        for st in (self._hud_info, self._hud_capture):
+            st.setTextFormat(Qt.PlainText)
+
         self.setMouseTracking(True)
 
     def set_frame(self, frame: np.ndarray):
@@ -427,16 +378,19 @@ class LiveViewWidget(QWidget):
         # info
         if self.overlay.info:
             p.setPen(QColor("#cfd6dd"))
-            p.setFont(QFont("Segoe UI", 10, QFont.Bold))
+            p.setFont(self._hud_font)
             txt = f"Zoom: {('Fit' if self._fit else f'{self._zoom:.2f}x')}   FPS: {self._fps:.1f}"
-            p.drawText(12, 22, txt)
+            if self._hud_info.text() != txt:
+                self._hud_info.setText(txt)
+            # (drawStaticText anchors the top-left; the old drawText anchored the baseline)
+            p.drawStaticText(QPointF(12, 22 - self._hud_ascent), self._hud_info)
 
         # 🆕 overlay captura dedicada (MODELO B)
         parent = self.parent()
         if parent is not None and getattr(parent, "_capture_running", False):
             p.setPen(QColor("#ffcc66"))
-            p.setFont(QFont("Segoe UI", 10, QFont.Bold))
-            p.drawText(12, 42, "LIVE (preview) — Capturando exposición dedicada")
+            p.setFont(self._hud_font)
+            p.drawStaticText(QPointF(12, 42 - self._hud_ascent), self._hud_capture)
 
 
 # ─────────────────────────────────────────────
@@ -551,7 +505,9 @@ class CameraPage(QWidget):
         self._last_frame: Optional[np.ndarray] = None
 
         # ───── Estado captura de vídeo (FireCapture style)
-        self._video_frames: list[np.ndarray] = []
+        # frames are encoded while recording (bounded queue), never kept in a list
+        self._video_writer: Optional[AVIStreamWriter] = None
+        self._video_capture_t0: float = 0.0
         self._video_capture_end_ts: float = 0.0
 
         # ───── Carpeta de capturas (FireCapture style)
@@ -960,92 +916,20 @@ class CameraPage(QWidget):
     # CAPTURA DEDICADA (MODELO B)
     # ─────────────────────────
 
-    def push_frame(self, frame):
-        if self._running:
-            self._frames.append(frame.copy())
-            if len(self._frames) % 50 == 0:
-                print("Frames capturados:", len(self._frames))
-
     def on_capture_dedicated(self):
         if self._capture_running:
             return
 
         duration = float(self.sp_cap_exp.value())
 
-        self._video_frames.clear()
-        self._capture_running = True
-        self._video_capture_end_ts = time.time() + duration
-
-
-
-    def save_avi(self, frames: list[np.ndarray], path: str, fps: int = 30):
-        if not frames:
-            raise RuntimeError("No hay frames para guardar")
-
-        h, w = frames[0].shape[:2]
-
-        fourcc = cv2.VideoWriter_fourcc(*"MJPG")
-        writer = cv2.VideoWriter(path, fourcc, fps, (w, h), isColor=True)
-
-        if not writer.isOpened():
-            raise RuntimeError("No se pudo abrir el writer AVI")
-
-        for f in frames:
-            if f.ndim == 2:
-                f = cv2.cvtColor(f, cv2.COLOR_GRAY2BGR)
-            writer.write(f)
-
-        writer.release()
-
-    # ─────────────────────────
-    # GUARDAR LARGA EXPOSICIÓN EN AVI
-    # ─────────────────────────
-
-    def _on_video_captured(self, frames):
-        self._capture_running = False
-
-        # desconectar captura
-        try:
-            self.live.frame_ready.disconnect(self._cap_worker.push_frame)
-        except Exception:
-            pass
-
-        self._cap_thread.quit()
-        self._cap_thread.wait()
-
-        if not frames:
-            QMessageBox.warning(self, "Captura", "No se capturaron frames.")
-            return
-
-        duration = float(self.sp_cap_exp.value())
-        fps_real = max(1, int(round(len(frames) / duration)))
-
-        out_dir = os.path.join(os.getcwd(), "captures")
-        os.makedirs(out_dir, exist_ok=True)
-
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = os.path.join(out_dir, f"capture_{ts}.avi")
-
-        # guardar AVI en background
-        self._avi_thread = QThread(self)
-        self._avi_worker = AviSaveWorker(frames, path, fps_real)
-
-        self._avi_worker.moveToThread(self._avi_thread)
-        self._avi_thread.started.connect(self._avi_worker.run)
-        self._avi_worker.finished.connect(self._avi_thread.quit)
-        self._avi_worker.error.connect(
-            lambda e: QMessageBox.critical(self, "Error AVI", e)
-        )
-
-        self._avi_thread.start()
-
-        QMessageBox.information(
-            self,
-            "Captura finalizada",
-            f"Vídeo guardándose:\n{path}\n"
-            f"Frames: {len(frames)} | FPS: {fps_real}"
-        )
+        path = os.path.join(self._capture_dir, f"capture_{ts}.avi")
 
+        # opened at the live rate; the measured rate goes into the header at the end
+        self._video_writer = AVIStreamWriter(path, self.live.fps)
+        self._capture_running = True
+        self._video_capture_t0 = time.time()
+        self._video_capture_end_ts = self._video_capture_t0 + duration
 
     def _save_captured_frame(self, frame: np.ndarray):
         out_dir = os.path.join(os.getcwd(), "captures")
@@ -1092,7 +976,10 @@ class CameraPage(QWidget):
 
         # 🔥 CAPTURA DE VÍDEO (FireCapture style)
         if self._capture_running:
-            self._video_frames.append(frame.copy())
+            # encoder behind -> frame dropped (counted), the GUI thread never waits.
+            # owned: get_frame() returns a fresh array per call that the backend never touches again
+            # and LiveViewService made it read-only, so the encoder can hold it as is
+            self._video_writer.write(frame, owned=True)
 
             if time.time() >= self._video_capture_end_ts:
                 self._finish_video_capture()
@@ -1107,29 +994,28 @@ class CameraPage(QWidget):
     def _finish_video_capture(self):
         self._capture_running = False
 
-        frames = self._video_frames.copy()
-        self._video_frames.clear()
+        avi, self._video_writer = self._video_writer, None
+        elapsed = max(1e-6, time.time() - self._video_capture_t0)
+        fps_real = avi.count / elapsed
 
-        if not frames:
-            QMessageBox.warning(self, "Captura", "No se capturaron frames.")
+        try:
+            avi.close(fps=fps_real)
+        except Exception as e:
+            QMessageBox.critical(self, "Error AVI", str(e))
             return
 
-        duration = float(self.sp_cap_exp.value())
-        fps_real = max(1, int(round(len(frames) / duration)))
-
-        out_dir = os.path.join(os.getcwd(), "captures")
-        os.makedirs(out_dir, exist_ok=True)
-
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = os.path.join(self._capture_dir, f"capture_{ts}.avi")
+        if not avi.count:
+            QMessageBox.warning(self, "Captura", "No se capturaron frames.")
+            return
 
-        self.save_avi(frames, path, fps=fps_real)
+        msg = f"Frames: {avi.count} | FPS: {fps_real:.1f}"
+        if avi.dropped:
+            msg += f" | Descartados: {avi.dropped}"
 
         QMessageBox.information(
             self,
             "Captura finalizada",
-            f"Vídeo guardado:\n{path}\n"
-            f"Frames: {len(frames)} | FPS: {fps_real}"
+            f"Vídeo guardado:\n{avi.path}\n{msg}"
         )
 
     def select_capture_directory(self):
@@ -2,6 +2,7 @@ from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QPainter, QImage
 from PySide6.QtCore import Qt
 import cv2
+import numpy as np
 
 
 class LiveViewProjector(QWidget):
@@ -19,16 +20,22 @@ class LiveViewProjector(QWidget):
         if self.frame is None:
             return
 
-        rgb = cv2.cvtColor(self.frame, cv2.COLOR_GRAY2RGB)
-        h, w, _ = rgb.shape
+        if self.frame.ndim == 2 and self.frame.dtype == np.uint8:
+            # 8-bit mono: draw it as Grayscale8 directly (no 3x RGB expansion)
+            gray = np.ascontiguousarray(self.frame)
+            h, w = gray.shape
+            img = QImage(gray.data, w, h, w, QImage.Format_Grayscale8)
+        else:
+            rgb = cv2.cvtColor(self.frame, cv2.COLOR_GRAY2RGB)
+            h, w, _ = rgb.shape
 
-        img = QImage(
-            rgb.data,
-            w,
-            h,
-            3 * w,
-            QImage.Format_RGB888
-        )
+            img = QImage(
+                rgb.data,
+                w,
+                h,
+                3 * w,
+                QImage.Format_RGB888
+            )
 
         painter = QPainter(self)
         painter.drawImage(self.rect(), img)
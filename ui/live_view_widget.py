@@ -31,6 +31,9 @@ class LiveViewWidget(QWidget):
         self.wb_g = 1.0
         self.wb_b = 1.0
 
+        # Debayered preview pixels, reused every paint (only wrapped while painting)
+        self._rgb_buf: np.ndarray | None = None
+
     # ─────────────────────────────
     # API pública
     # ─────────────────────────────
@@ -68,7 +71,8 @@ class LiveViewWidget(QWidget):
     # ─────────────────────────────
     # Debayer
     # ─────────────────────────────
-    def _debayer(self, frame: np.ndarray) -> np.ndarray:
+    def _debayer(self, frame: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        # out: reusable RGB buffer (used when its shape/dtype match)
         bayer_map = {
             "RGGB": cv2.COLOR_BayerRG2RGB,
             "BGGR": cv2.COLOR_BayerBG2RGB,
@@ -78,12 +82,12 @@ class LiveViewWidget(QWidget):
 
         code = bayer_map.get(self.bayer_pattern)
         if code is None:
-            return cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
+            return cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB, dst=out)
 
         try:
-            return cv2.cvtColor(frame, code)
+            return cv2.cvtColor(frame, code, dst=out)
         except Exception:
-            return cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
+            return cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB, dst=out)
         
     # ─────────────────────────────
     # Auto-Debayer
@@ -169,16 +173,6 @@ class LiveViewWidget(QWidget):
 
         self.update()
 
-    def _apply_soft_ir_cut(self, rgb: np.ndarray) -> np.ndarray:
-        # ⚠️ SIEMPRE trabajar en float
-        out = rgb.astype(np.float32)
-
-        out[..., 0] *= 0.85   # R
-        out[..., 1] *= 1.00   # G
-        out[..., 2] *= 1.05   # B
-
-        return np.clip(out, 0, 255).astype(np.uint8)
-
 
     def set_white_balance(self, r: float, g: float, b: float):
         self.wb_r = float(r)
@@ -187,13 +181,16 @@ class LiveViewWidget(QWidget):
         self.update()
 
 
-    def _apply_white_balance(self, rgb: np.ndarray) -> np.ndarray:
-        out = rgb.astype(np.float32)
+    def _apply_color_gains(self, rgb: np.ndarray) -> np.ndarray:
+        # Soft IR-cut (R 0.85, B 1.05) and white balance folded into one gain per channel
+        gains = (0.85 * self.wb_r, 1.00 * self.wb_g, 1.05 * self.wb_b)
 
-        out[..., 0] *= self.wb_r
-        out[..., 1] *= self.wb_g
-        out[..., 2] *= self.wb_b
+        if rgb.dtype == np.uint8:
+            # in place, saturating to 0..255 in one OpenCV pass
+            return cv2.multiply(rgb, gains + (0.0,), dst=rgb)
 
+        out = rgb.astype(np.float32)
+        out *= np.array(gains, dtype=np.float32)
         return np.clip(out, 0, 255).astype(np.uint8)
 
     # ─────────────────────────────
@@ -209,30 +206,43 @@ class LiveViewWidget(QWidget):
 
         frame = self.frame
 
-        # ── Color / mono
-        if frame.ndim == 2 and self.show_color:
-            rgb = self._debayer(frame)
-            rgb = self._apply_soft_ir_cut(rgb)
-            rgb = self._apply_white_balance(rgb)
-
-        elif frame.ndim == 2:
-            rgb = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
+        # ── Mono 8-bit: wrap the frame as Grayscale8 (no GRAY2RGB expansion / copy)
+        if frame.ndim == 2 and not self.show_color and frame.dtype == np.uint8:
+            gray = np.ascontiguousarray(frame)
+            h, w = gray.shape
+
+            image = QImage(
+                gray.data,
+                w,
+                h,
+                w,
+                QImage.Format_Grayscale8
+            )
 
         else:
-            rgb = frame
+            # ── Color / mono
+            if frame.ndim == 2 and self.show_color:
+                rgb = self._rgb_buf = self._debayer(frame, self._rgb_buf)
+                rgb = self._apply_color_gains(rgb)
 
-        # 🔥 CLAVE
-        rgb = np.ascontiguousarray(rgb)
+            elif frame.ndim == 2:
+                rgb = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
 
-        h, w, _ = rgb.shape
+            else:
+                rgb = frame
 
-        image = QImage(
-            rgb.data,
-            w,
-            h,
-            3 * w,
-            QImage.Format_RGB888
-        )
+            # 🔥 CLAVE
+            rgb = np.ascontiguousarray(rgb)
+
+            h, w, _ = rgb.shape
+
+            image = QImage(
+                rgb.data,
+                w,
+                h,
+                3 * w,
+                QImage.Format_RGB888
+            )
 
         canvas_w = self.width()
         canvas_h = self.height()
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPainter, QPen, QImage, QFont
-from PySide6.QtCore import Qt, QRectF, QPointF
+from PySide6.QtGui import QPainter, QPainterPath, QPen, QImage, QFont, QPixmap, QFontMetricsF
+from PySide6.QtCore import Qt, QPointF, QTimer
 
 
 class OverlayLiveView(QWidget):
@@ -16,13 +16,95 @@ class OverlayLiveView(QWidget):
         self.setFixedSize(width, height)
 
         self.image: QImage | None = None
+        # Full-res frame width when `image` is a downscaled preview
+        # (rotation-center coordinates stay in full-res pixels)
+        self._src_w: int | None = None
 
         self.rot_center: tuple[float, float] | None = None
         self.show_center = True
 
+        self._build_pens()
+
+        # Streaming frames are scaled nearest-neighbour; once the image has been
+        # idle for 300 ms it is repainted once with smooth scaling
+        self._hi_quality = False
+        self._hq_timer = QTimer(self)
+        self._hq_timer.setSingleShot(True)
+        self._hq_timer.setInterval(300)
+        self._hq_timer.timeout.connect(self._on_idle)
+
+        # Field-centre cross as one path, rebuilt only on resize
+        self._center_path = self._build_center_path()
+
+        # Scaled frame reused by overlay-only repaints: key = (image, widget size, quality)
+        self._scaled_pix: QPixmap | None = None
+        self._scaled_key = None
+
+    def _build_pens(self):
+        # Static paint objects: built once, reused on every repaint
+        self._pen_center = QPen(Qt.green)
+        self._pen_center.setWidth(1)
+
+        self._pen_rot = QPen(Qt.red)
+        self._pen_rot.setWidth(2)
+
+        self._pen_arrow = QPen(Qt.yellow)
+        self._pen_arrow.setWidth(2)
+
+        self._font_hud = QFont()
+        self._font_hud.setPointSize(11)
+        self._font_hud.setBold(True)
+
+        # HUD labels pre-rendered per (text, dpr): only 4 ALT/AZI combinations exist
+        self._hud_pix: dict[tuple[str, float], QPixmap] = {}
+        self._hud_ascent = QFontMetricsF(self._font_hud).ascent()
+
+    def _hud_label(self, txt: str) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pix = self._hud_pix.get((txt, dpr))
+        if pix is None:
+            fm = QFontMetricsF(self._font_hud)
+            pix = QPixmap(
+                int((fm.horizontalAdvance(txt) + 2) * dpr) + 1,
+                int(fm.height() * dpr) + 1,
+            )
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+
+            q = QPainter(pix)
+            q.setRenderHint(QPainter.Antialiasing)
+            q.setPen(self._pen_arrow)
+            q.setFont(self._font_hud)
+            q.drawText(QPointF(0, fm.ascent()), txt)
+            q.end()
+            self._hud_pix[(txt, dpr)] = pix
+        return pix
+
+    def _build_center_path(self) -> QPainterPath:
+        cx = self.width() / 2
+        cy = self.height() / 2
+        path = QPainterPath()
+        path.moveTo(cx - 15, cy)
+        path.lineTo(cx + 15, cy)
+        path.moveTo(cx, cy - 15)
+        path.lineTo(cx, cy + 15)
+        return path
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._center_path = self._build_center_path()
+
     # ─────────────────────────────────────────────
-    def set_image(self, img: QImage):
+    def set_image(self, img: QImage, src_w: int | None = None):
         self.image = img
+        self._src_w = src_w
+        self._scaled_key = None
+        self._hi_quality = False
+        self._hq_timer.start()
+        self.update()
+
+    def _on_idle(self):
+        self._hi_quality = True
         self.update()
 
     def set_rotation_center(self, center_xy: tuple[float, float] | None):
@@ -36,7 +118,6 @@ class OverlayLiveView(QWidget):
     # ─────────────────────────────────────────────
     def paintEvent(self, event):
         p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
 
         w = self.width()
         h = self.height()
@@ -52,19 +133,25 @@ class OverlayLiveView(QWidget):
             img_h = self.image.height()
 
             scale = min(w / img_w, h / img_h)
-            draw_w = img_w * scale
-            draw_h = img_h * scale
+            draw_w = max(1, round(img_w * scale))
+            draw_h = max(1, round(img_h * scale))
 
             x0 = (w - draw_w) / 2
             y0 = (h - draw_h) / 2
 
-            target = QRectF(x0, y0, draw_w, draw_h)
-            source = QRectF(0, 0, img_w, img_h)
+            # Scale once per (frame, size, quality); overlay-only repaints just blit
+            key = (self.image.cacheKey(), w, h, self._hi_quality)
+            if key != self._scaled_key:
+                mode = Qt.SmoothTransformation if self._hi_quality else Qt.FastTransformation
+                self._scaled_pix = QPixmap.fromImage(
+                    self.image.scaled(draw_w, draw_h, Qt.IgnoreAspectRatio, mode)
+                )
+                self._scaled_key = key
 
-            p.drawImage(target, self.image, source)
+            p.drawPixmap(QPointF(x0, y0), self._scaled_pix)
 
-            # Guardamos transformación para overlays
-            self._scale = scale
+            # Guardamos transformación para overlays (full-res px -> widget)
+            self._scale = draw_w / self._src_w if self._src_w else scale
             self._offset = QPointF(x0, y0)
         else:
             self._scale = 1.0
@@ -72,11 +159,7 @@ class OverlayLiveView(QWidget):
 
         # ── Cruz central (del campo) ─────────────
         if self.show_center:
-            pen = QPen(Qt.green)
-            pen.setWidth(1)
-            p.setPen(pen)
-            p.drawLine(cx - 15, cy, cx + 15, cy)
-            p.drawLine(cx, cy - 15, cx, cy + 15)
+            p.strokePath(self._center_path, self._pen_center)
 
         # ── Error polar ──────────────────────────
         if self.rot_center:
@@ -87,17 +170,16 @@ class OverlayLiveView(QWidget):
             ry_w = self._offset.y() + ry * self._scale
 
             # Cruz centro rotación
-            pen_rot = QPen(Qt.red)
-            pen_rot.setWidth(2)
-            p.setPen(pen_rot)
+            p.setPen(self._pen_rot)
             p.drawLine(rx_w - 12, ry_w, rx_w + 12, ry_w)
             p.drawLine(rx_w, ry_w - 12, rx_w, ry_w + 12)
 
-            # Flecha centro → error
-            pen_arrow = QPen(Qt.yellow)
-            pen_arrow.setWidth(2)
-            p.setPen(pen_arrow)
+            # Flecha centro → error (the only diagonal stroke: antialias just this one;
+            # the axis-aligned crosses gain nothing from it)
+            p.setPen(self._pen_arrow)
+            p.setRenderHint(QPainter.Antialiasing, True)
             p.drawLine(cx, cy, rx_w, ry_w)
+            p.setRenderHint(QPainter.Antialiasing, False)
 
             # Texto ALT / AZI
             dx = rx_w - cx
@@ -106,14 +188,10 @@ class OverlayLiveView(QWidget):
             az_txt = "AZI →" if dx > 0 else "AZI ←"
             alt_txt = "ALT ↓" if dy > 0 else "ALT ↑"
 
-            font = QFont()
-            font.setPointSize(11)
-            font.setBold(True)
-            p.setFont(font)
-
-            p.drawText(
-                QPointF(cx + dx / 2 + 6, cy + dy / 2 - 6),
-                f"{az_txt}  {alt_txt}"
+            # baseline at the old drawText anchor -> pixmap top-left is one ascent above
+            p.drawPixmap(
+                QPointF(cx + dx / 2 + 6, cy + dy / 2 - 6 - self._hud_ascent),
+                self._hud_label(f"{az_txt}  {alt_txt}")
             )
 
         p.end()
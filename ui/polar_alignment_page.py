@@ -13,14 +13,19 @@
 
 from __future__ import annotations
 
+import cmath
+import functools
 import math
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional, Tuple, List
+import zlib
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 
+import cv2
 import numpy as np
 
-from PySide6.QtCore import Qt, QRectF, QTimer, QSize
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QThread, QCoreApplication, QRectF, QLineF, QTimer, QSize
 from PySide6.QtGui import (
     QImage,
     QPixmap,
@@ -28,6 +33,7 @@ from PySide6.QtGui import (
     QBrush,
     QColor,
     QFont,
+    QPainter,
 )
 from PySide6.QtWidgets import (
     QWidget,
@@ -39,6 +45,7 @@ from PySide6.QtWidgets import (
     QComboBox,
     QGraphicsView,
     QGraphicsScene,
+    QGraphicsItem,
     QGraphicsPixmapItem,
     QGraphicsEllipseItem,
     QGraphicsLineItem,
@@ -46,6 +53,11 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except Exception:
+    QOpenGLWidget = None
+
 
 # ─────────────────────────────────────────────
 # FrameBus safe import / singleton accessor
@@ -88,46 +100,116 @@ def _get_frame_bus():
 # ─────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────
-def _qimage_from_ndarray(frame: np.ndarray) -> QImage:
+# dtypes cv2.resize accepts
+_RESIZE_DTYPES = tuple(np.dtype(t) for t in (np.uint8, np.uint16, np.int16, np.float32, np.float64))
+
+# dtypes cv2.threshold + cv2.moments both accept
+_MOMENT_DTYPES = tuple(np.dtype(t) for t in (np.uint8, np.uint16, np.int16, np.float32, np.float64))
+
+# dtypes OpenCV can take as-is (others go through float32)
+_CV_DTYPES = tuple(np.dtype(t) for t in (np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64))
+
+
+def _min_max(arr: np.ndarray) -> Tuple[float, float]:
+    if arr.ndim == 2 and arr.dtype in _CV_DTYPES:
+        lo, hi, _, _ = cv2.minMaxLoc(arr)  # single reduction for both
+        return lo, hi
+    return arr.min().item(), arr.max().item()
+
+
+def _to_uint8(
+    arr: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    lohi: Optional[Tuple[float, float]] = None,
+) -> np.ndarray:
+    """
+    Min/max stretch to 0..255 in ONE pass: convertScaleAbs does
+    scale + offset + saturate-cast straight to uint8 (no float temporaries).
+    `out` (uint8, same shape) is reused when given; `lohi` skips the min/max scan.
     """
-    Accepts:
-      - grayscale HxW uint8/uint16/float
-      - RGB/RGBA HxWx3/4 uint8
-    Returns a QImage that is safe to convert to QPixmap.
+    if arr.size == 0:
+        return np.zeros(arr.shape, dtype=np.uint8)
+    if arr.dtype not in _CV_DTYPES:
+        arr = arr.astype(np.float32)
+    lo, hi = lohi if lohi is not None else _min_max(arr)
+    alpha = 255.0 / (hi - lo) if hi > lo else 0.0
+    if out is None:
+        return cv2.convertScaleAbs(arr, alpha=alpha, beta=-lo * alpha)
+    return cv2.convertScaleAbs(arr, dst=out, alpha=alpha, beta=-lo * alpha)
+
+
+def _reuse_buf(buf: Optional[np.ndarray], shape, dtype) -> np.ndarray:
+    """Returns buf if it already matches shape/dtype, else a fresh empty array."""
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        return np.empty(shape, dtype=dtype)
+    return buf
+
+
+def _target_geom(w: float, h: float) -> Tuple[float, float]:
+    """Target circle radius (18%, NINA-ish) and crosshair half-length (22%) for a w x h frame."""
+    m = min(w, h)
+    return max(40.0, m * 0.18), max(80.0, m * 0.22)
+
+
+def _payload_extractor(payload):
     """
-    if frame is None:
-        return QImage()
-
-    arr = frame
-    if not isinstance(arr, np.ndarray):
-        return QImage()
-
-    # Normalize types
-    if arr.dtype != np.uint8:
-        # scale to 0..255
-        a = arr.astype(np.float32)
-        a -= float(np.min(a)) if a.size else 0.0
-        mx = float(np.max(a)) if a.size else 1.0
-        if mx <= 0:
-            mx = 1.0
-        a = (a / mx) * 255.0
-        arr = np.clip(a, 0, 255).astype(np.uint8)
-
-    if arr.ndim == 2:
-        h, w = arr.shape
-        # grayscale
-        qimg = QImage(arr.data, w, h, w, QImage.Format_Grayscale8)
-        return qimg.copy()  # detach from numpy memory
-    elif arr.ndim == 3:
-        h, w, ch = arr.shape
-        if ch == 3:
-            qimg = QImage(arr.data, w, h, w * 3, QImage.Format_RGB888)
-            return qimg.copy()
-        if ch == 4:
-            qimg = QImage(arr.data, w, h, w * 4, QImage.Format_RGBA8888)
-            return qimg.copy()
-
-    return QImage()
+    Picks the unwrapper for a FrameBus payload type (done once, not per frame):
+      - numpy array -> as is
+      - dict {frame:..., ts:...} -> payload["frame"]
+    Returns None for anything else.
+    """
+    if isinstance(payload, np.ndarray):
+        return lambda f: f
+    if isinstance(payload, dict) and isinstance(payload.get("frame"), np.ndarray):
+        return lambda f: f["frame"]
+    return None
+
+
+def _frame_sig(arr: np.ndarray) -> Tuple:
+    """
+    Frame fingerprint: CRC32 of every pixel + shape/dtype, so any change
+    (Polaris moving over a clipped-black background included) gives a new
+    signature. ~3 GB/s: well under a ms for typical preview frames.
+    """
+    return arr.shape, arr.dtype.str, zlib.crc32(np.ascontiguousarray(arr))
+
+
+@dataclass
+class _FramePrep:
+    """
+    Per-frame products shared by render + solve (computed once per frame):
+      - qimg: display image (uint8, normalized if needed)
+      - gray: grayscale in the source dtype (mono: view, no copy) used by the centroid search
+    """
+    src: np.ndarray
+    qimg: QImage
+    gray: np.ndarray
+    gen: int
+
+
+def _to_gray(img: np.ndarray) -> np.ndarray:
+    """
+    Mono frames pass through untouched (no copy).
+    RGB/RGBA -> luminance via OpenCV (SIMD); exotic dtypes fall back to channel 0.
+    """
+    if img.ndim == 2:
+        return img
+    if img.shape[2] in (3, 4) and img.dtype in (np.uint8, np.uint16, np.float32):
+        code = cv2.COLOR_RGBA2GRAY if img.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+        return cv2.cvtColor(img, code)
+    return img[..., 0]
+
+
+def _set_rect_if_changed(item, rect: QRectF):
+    # every setRect invalidates the scene, even with identical geometry
+    if item.rect() != rect:
+        item.setRect(rect)
+
+
+def _set_line_if_changed(item, x1: float, y1: float, x2: float, y2: float):
+    line = QLineF(x1, y1, x2, y2)
+    if item.line() != line:
+        item.setLine(line)
 
 
 def _clamp(v: float, a: float, b: float) -> float:
@@ -138,6 +220,69 @@ def _dist(a: Tuple[float, float], b: Tuple[float, float]) -> float:
     return math.hypot(a[0] - b[0], a[1] - b[1])
 
 
+def _peak_xy(a: np.ndarray) -> Tuple[int, int]:
+    """(x, y) of the brightest pixel of a 2D array (first one on ties)."""
+    if a.dtype in _CV_DTYPES:
+        _, _, _, loc = cv2.minMaxLoc(a)
+        return loc
+    iy, ix = np.unravel_index(int(np.argmax(a)), a.shape)
+    return int(ix), int(iy)
+
+
+def _coarse_peak_xy(a: np.ndarray, step: int = 4) -> Tuple[int, int]:
+    """
+    Brightest pixel via a coarse pass: max over each step x step block
+    (step² fewer candidates for the argmax, but every pixel is looked at,
+    so a 1 px star can't fall between samples), then the winning block is
+    searched at full res. Rows / columns past the last full block are
+    checked directly.
+    """
+    h, w = a.shape[:2]
+    hb, wb = h // step, w // step
+    if hb == 0 or wb == 0:
+        return _peak_xy(a)
+
+    # block max over the cropped region: fold the step rows of each block
+    # together, then the step columns (in-place np.maximum, no big temporaries)
+    rows = a[: hb * step, : wb * step].reshape(hb, step, wb * step)
+    m = rows[:, 0].copy()
+    for dy in range(1, step):
+        np.maximum(m, rows[:, dy], out=m)
+    cols = m.reshape(hb, wb, step)
+    blocks = cols[:, :, 0].copy()
+    for dx in range(1, step):
+        np.maximum(blocks, cols[:, :, dx], out=blocks)
+    by, bx = np.unravel_index(int(np.argmax(blocks)), blocks.shape)
+    rx, ry = _peak_xy(a[by * step : (by + 1) * step, bx * step : (bx + 1) * step])
+    best = (bx * step + rx, by * step + ry)
+    best_v = a[best[1], best[0]]
+
+    # leftovers: bottom strip (full width) and right strip (above it)
+    for y0, x0, strip in ((hb * step, 0, a[hb * step :, :]), (0, wb * step, a[: hb * step, wb * step :])):
+        if strip.size:
+            sx, sy = _peak_xy(strip)
+            if strip[sy, sx] > best_v:
+                best, best_v = (x0 + sx, y0 + sy), strip[sy, sx]
+    return int(best[0]), int(best[1])
+
+
+# peak must clear the search region's background median by this many MADs
+# (~6.7 sigma for Gaussian noise: the max of a noise-only ROI stays below it)
+_DETECT_K = 10.0
+
+
+def _is_detection(region: np.ndarray, peak: float) -> bool:
+    """
+    True if `peak` stands out of `region`'s background: peak > median + k·MAD.
+    Background stats come from a 4x strided sample (the median doesn't need
+    every pixel); a flat region (peak == median) is never a detection.
+    """
+    sample = region[::4, ::4] if min(region.shape[:2]) >= 32 else region
+    med = float(np.median(sample))
+    mad = float(np.median(np.abs(sample - med)))
+    return peak > med + _DETECT_K * mad
+
+
 def _centroid_brightest(
     img: np.ndarray,
     seed: Optional[Tuple[float, float]] = None,
@@ -147,16 +292,15 @@ def _centroid_brightest(
     Robust enough for Polaris-like field:
     - if seed exists: search in a window around seed (stabilizes point)
     - else: search whole image
-    Returns (x, y) centroid of brightest blob-ish region.
+    Returns (x, y) centroid of brightest blob-ish region, or None if the
+    brightest pixel doesn't stand out of the searched region (see _is_detection).
     """
     if img is None or not isinstance(img, np.ndarray) or img.size == 0:
         return None
 
-    # ensure grayscale float
-    if img.ndim == 3:
-        img_g = img[..., 0].astype(np.float32)
-    else:
-        img_g = img.astype(np.float32)
+    # grayscale in the source dtype: peak search, threshold and moments all run
+    # natively on uint8/uint16 (only exotic dtypes get a float32 patch)
+    img_g = _to_gray(img)
 
     h, w = img_g.shape[:2]
 
@@ -169,12 +313,17 @@ def _centroid_brightest(
         roi = img_g[y0 : y1 + 1, x0 : x1 + 1]
         if roi.size == 0:
             return None
-        # brightest pixel
-        iy, ix = np.unravel_index(int(np.argmax(roi)), roi.shape)
+        # brightest pixel (coarse strided pass for large ROIs)
+        ix, iy = _coarse_peak_xy(roi) if search_radius >= 60 else _peak_xy(roi)
         px = x0 + ix
         py = y0 + iy
+        region = roi
     else:
-        py, px = np.unravel_index(int(np.argmax(img_g)), img_g.shape)
+        px, py = _coarse_peak_xy(img_g)
+        region = img_g
+
+    if not _is_detection(region, float(img_g[py, px])):
+        return None
 
     # small window around the peak for centroid
     win = 18
@@ -183,30 +332,104 @@ def _centroid_brightest(
     y0 = int(_clamp(py - win, 0, h - 1))
     y1 = int(_clamp(py + win, 0, h - 1))
     patch = img_g[y0 : y1 + 1, x0 : x1 + 1]
+    owned = patch.dtype not in _MOMENT_DTYPES
+    if owned:
+        patch = patch.astype(np.float32)
     if patch.size == 0:
         return None
 
     # threshold relative to peak
-    peak = float(np.max(patch))
+    _, peak, _, _ = cv2.minMaxLoc(patch)
     if peak <= 0:
         return None
 
-    thr = peak * 0.60
-    mask = patch >= thr
-    if not np.any(mask):
-        return float(px), float(py)
-
-    yy, xx = np.nonzero(mask)
-    weights = patch[yy, xx]
-    s = float(np.sum(weights))
+    # zero everything under 60% of the peak (in place if the patch is our own copy),
+    # then one moments pass: m00 = sum, m10/m01 = x/y weighted sums
+    _, thr_patch = cv2.threshold(patch, peak * 0.60, 0, cv2.THRESH_TOZERO, dst=patch if owned else None)
+    m = cv2.moments(thr_patch)
+    s = m["m00"]
     if s <= 0:
         return float(px), float(py)
 
-    cx = float(np.sum((x0 + xx) * weights) / s)
-    cy = float(np.sum((y0 + yy) * weights) / s)
+    cx = x0 + m["m10"] / s
+    cy = y0 + m["m01"] / s
     return cx, cy
 
 
+def _locate_polaris(
+    img: np.ndarray,
+    seeds: Tuple[Optional[Tuple[float, float]], ...],
+) -> Optional[Tuple[float, float]]:
+    """
+    Seeded search first, full-frame argmax only as a last resort.
+    Each candidate seed is tried with a growing ROI; the first search whose
+    peak passes _is_detection wins (a noise-only ROI moves on to the next one).
+    """
+    for seed in seeds:
+        if seed is None:
+            continue
+        for radius in (140, 280, 560):
+            p = _centroid_brightest(img, seed=seed, search_radius=radius)
+            if p is not None:
+                return p
+
+    return _centroid_brightest(img, seed=None)
+
+
+@functools.lru_cache(maxsize=8192)
+def _fmt_arcmin_centi(centi: int) -> str:
+    # Show like 00° 05′ 22″ style: integer arcseconds (rounded, not truncated)
+    # split with divmod, so float error can't drop the last second
+    sign = "-" if centi < 0 else ""
+    total_sec = (abs(centi) * 60 + 50) // 100
+    deg, rem = divmod(total_sec, 3600)
+    minute, sec = divmod(rem, 60)
+    return f"{sign}{deg:02d}° {minute:02d}′ {sec:02d}″"
+
+
+# ─────────────────────────────────────────────
+# Solver worker (keeps numpy work off the GUI thread)
+# ─────────────────────────────────────────────
+class _SolverWorker(QObject):
+    """
+    Single-slot mailbox: submit() overwrites any job not picked up yet,
+    so a slow solve drops stale frames instead of queueing them.
+    Only numpy arrays / tuples cross threads; results go back via `solved`.
+    """
+    solved = Signal(object, float, int, float)  # (x, y) or None, frame time, epoch, solve ms
+    _kick = Signal()
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._pending = None
+        self._kick.connect(self._process)
+
+    def submit(self, gray: np.ndarray, seeds, t: float, epoch: int):
+        with self._lock:
+            was_empty = self._pending is None
+            self._pending = (gray, seeds, t, epoch)
+        # A wake-up is already queued if the slot was full: the worker will
+        # pick up this newer job instead (older one dropped silently).
+        if was_empty:
+            self._kick.emit()
+
+    @Slot()
+    def _process(self):
+        with self._lock:
+            job, self._pending = self._pending, None
+        if job is None:
+            return
+
+        gray, seeds, t, epoch = job
+        t0 = time.perf_counter()
+        try:
+            p = _locate_polaris(gray, seeds)
+        except Exception:
+            p = None
+        self.solved.emit(p, t, epoch, (time.perf_counter() - t0) * 1000.0)
+
+
 # ─────────────────────────────────────────────
 # ✅ 3-Point Calibrator (added)
 # ─────────────────────────────────────────────
@@ -215,39 +438,42 @@ def _circumcenter(a: Tuple[float, float], b: Tuple[float, float], c: Tuple[float
     Returns circumcenter of triangle ABC (circle through 3 points).
     If nearly collinear -> None.
     """
+    # translate so A is the origin: same determinant, better conditioned for
+    # large pixel coordinates, fewer multiplies
     ax, ay = a
-    bx, by = b
-    cx, cy = c
+    bx, by = b[0] - ax, b[1] - ay
+    cx, cy = c[0] - ax, c[1] - ay
 
-    d = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    d = 2.0 * (bx * cy - by * cx)
     if abs(d) < 1e-6:
         return None
 
-    ax2ay2 = ax * ax + ay * ay
-    bx2by2 = bx * bx + by * by
-    cx2cy2 = cx * cx + cy * cy
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
 
-    ux = (ax2ay2 * (by - cy) + bx2by2 * (cy - ay) + cx2cy2 * (ay - by)) / d
-    uy = (ax2ay2 * (cx - bx) + bx2by2 * (ax - cx) + cx2cy2 * (bx - ax)) / d
-    return (float(ux), float(uy))
+    ux = (cy * b2 - by * c2) / d
+    uy = (bx * c2 - cx * b2) / d
+    return (ax + ux, ay + uy)
 
 
 @dataclass
 class ThreePointState:
-    points: List[Tuple[float, float]] = None  # captured polaris positions
+    # captured polaris positions: (x, y) rows, first n_points valid
+    points: np.ndarray = field(default_factory=lambda: np.zeros((3, 2), np.float64))
+    n_points: int = 0
     center: Optional[Tuple[float, float]] = None
     calibrated: bool = False
     capturing: bool = False
     last_capture_t: float = 0.0
 
-    # stability buffer
-    stable_buf: List[Tuple[float, float]] = None
+    # stability ring buffer: (x, y) rows, stable_n valid, next write at stable_idx
+    stable_arr: np.ndarray = field(default_factory=lambda: np.zeros((8, 2), np.float32))
+    stable_n: int = 0
+    stable_idx: int = 0
 
-    def __post_init__(self):
-        if self.points is None:
-            self.points = []
-        if self.stable_buf is None:
-            self.stable_buf = []
+    def clear_stable(self):
+        self.stable_n = 0
+        self.stable_idx = 0
 
 
 class ThreePointCalibrator:
@@ -271,16 +497,12 @@ class ThreePointCalibrator:
         self.s = ThreePointState()
 
     @staticmethod
-    def _rms_jitter(buf: List[Tuple[float, float]]) -> float:
+    def _rms_jitter(buf: np.ndarray) -> float:
+        # buf: (N, 2) samples
         if len(buf) < 2:
             return 999.0
-        xs = np.array([p[0] for p in buf], dtype=np.float32)
-        ys = np.array([p[1] for p in buf], dtype=np.float32)
-        mx = float(xs.mean())
-        my = float(ys.mean())
-        dx = xs - mx
-        dy = ys - my
-        return float(np.sqrt((dx * dx + dy * dy).mean()))
+        d = buf - buf.mean(axis=0)
+        return math.sqrt((d * d).sum(axis=1).mean())  # math.sqrt hands back a Python float
 
     def update(self, polaris_xy: Optional[Tuple[float, float]], now: float) -> Tuple[bool, str]:
         """
@@ -288,58 +510,65 @@ class ThreePointCalibrator:
         Returns (changed, status_text).
         """
         if polaris_xy is None:
-            self.s.stable_buf.clear()
+            self.s.clear_stable()
             return (False, "Calibración: esperando detección de Polaris…")
 
         # If already calibrated, nothing to do
         if self.s.calibrated:
             return (False, "Calibración: OK (3-point)")
 
-        # Collect stability samples
-        self.s.stable_buf.append(polaris_xy)
-        if len(self.s.stable_buf) > self.stable_window:
-            self.s.stable_buf.pop(0)
+        # Collect stability samples (ring buffer sized to stable_window)
+        s = self.s
+        if s.stable_arr.shape[0] != self.stable_window:
+            s.stable_arr = np.zeros((self.stable_window, 2), np.float32)
+            s.clear_stable()
+        s.stable_arr[s.stable_idx] = polaris_xy
+        s.stable_idx = (s.stable_idx + 1) % self.stable_window
+        s.stable_n = min(s.stable_n + 1, self.stable_window)
 
         # Not enough samples yet
-        if len(self.s.stable_buf) < self.stable_window:
-            return (False, f"Calibración: estabilizando… ({len(self.s.points)}/3)")
+        if s.stable_n < self.stable_window:
+            return (False, f"Calibración: estabilizando… ({self.s.n_points}/3)")
 
-        rms = self._rms_jitter(self.s.stable_buf)
+        buf = s.stable_arr[: s.stable_n]
+        rms = self._rms_jitter(buf)
         if rms > self.stable_max_rms:
-            return (False, f"Calibración: espera a que se estabilice (jitter {rms:.1f}px)… ({len(self.s.points)}/3)")
+            return (False, f"Calibración: espera a que se estabilice (jitter {rms:.1f}px)… ({self.s.n_points}/3)")
 
         # Stable -> candidate capture
         if (now - self.s.last_capture_t) < self.min_time_between_captures:
-            return (False, f"Calibración: estable ✓ (esperando… {len(self.s.points)}/3)")
+            return (False, f"Calibración: estable ✓ (esperando… {self.s.n_points}/3)")
 
         # Enforce movement between captures
-        if self.s.points:
-            last = self.s.points[-1]
+        if s.n_points:
+            last = s.points[s.n_points - 1]
             if _dist(last, polaris_xy) < self.min_move_px:
-                return (False, f"Calibración: mueve RA un poco (≥{int(self.min_move_px)}px)… ({len(self.s.points)}/3)")
+                return (False, f"Calibración: mueve RA un poco (≥{int(self.min_move_px)}px)… ({self.s.n_points}/3)")
 
         # Capture this point (use mean of stable buffer)
-        xs = [p[0] for p in self.s.stable_buf]
-        ys = [p[1] for p in self.s.stable_buf]
-        cap = (float(np.mean(xs)), float(np.mean(ys)))
+        cap = tuple(buf.mean(axis=0).tolist())
 
-        self.s.points.append(cap)
+        if s.points.shape[0] < self.max_points:
+            s.points = np.resize(s.points, (self.max_points, 2))
+        s.points[s.n_points] = cap
+        s.n_points += 1
         self.s.last_capture_t = now
-        self.s.stable_buf.clear()
+        self.s.clear_stable()
 
         # If we reached 3 points -> compute center
-        if len(self.s.points) >= self.max_points:
-            a, b, c = self.s.points[0], self.s.points[1], self.s.points[2]
+        if self.s.n_points >= self.max_points:
+            # plain Python floats: scalar math on NumPy elements is several times slower
+            a, b, c = self.s.points[:3].tolist()
             cc = _circumcenter(a, b, c)
             if cc is None:
                 # points too collinear -> ask for better movement
-                self.s.points.pop()  # drop last to try again
+                self.s.n_points -= 1  # drop last to try again
                 return (True, "Calibración: puntos casi alineados. Mueve RA MÁS y repite… (2/3)")
             self.s.center = cc
             self.s.calibrated = True
             return (True, "Calibración: OK ✅ (centro del eje RA calculado)")
         else:
-            return (True, f"Calibración: punto {len(self.s.points)}/3 capturado ✅ (mueve RA para el siguiente)")
+            return (True, f"Calibración: punto {self.s.n_points}/3 capturado ✅ (mueve RA para el siguiente)")
 
 
 # ─────────────────────────────────────────────
@@ -359,6 +588,18 @@ class AlignmentState:
     arcsec_per_px: float = 2.0  # default; editable in UI
 
 
+# Demo Polaris PSF: sigma 2.2 px, exponent factor -1/(2σ²)
+_DEMO_PSF_K = np.float32(-1.0 / (2 * 2.2 ** 2))
+
+
+@functools.lru_cache(maxsize=8)
+def _arange_f32(n: int) -> np.ndarray:
+    # shared pixel-offset ramp 0..n-1 (read-only: callers only use it as an operand)
+    a = np.arange(n, dtype=np.float32)
+    a.flags.writeable = False
+    return a
+
+
 # ─────────────────────────────────────────────
 # Main Page
 # ─────────────────────────────────────────────
@@ -375,6 +616,39 @@ class PolarAlignmentPage(QWidget):
 
         self.state = AlignmentState()
         self._last_frame: Optional[np.ndarray] = None
+        self._arcmin_per_px = self.state.arcsec_per_px / 60.0  # kept in sync by _on_scale_changed
+
+        # Frame prep cache (see _prepare); scratch buffers are reused across frames
+        self._frame_gen = 0
+        self._prep: Optional[_FramePrep] = None
+        self._u8_buf: Optional[np.ndarray] = None
+
+        # Stable uint8 buffer behind the display QImage (see _to_qimage)
+        self._display_buf: Optional[np.ndarray] = None
+        self._last_qimage: Optional[QImage] = None
+        self._qimg_owner: Optional[np.ndarray] = None
+        self._last_rendered_gen = -1
+        self._fit_size: Optional[Tuple[int, int]] = None
+        self._viewport_px: Tuple[int, int] = (0, 0)  # device pixels, updated in resizeEvent
+
+        # Overlay only needs re-layout after state changes (see _tick_ui)
+        self._overlay_dirty = True
+        self._ui_ticks = 0
+        self._overlay_baked = False  # target circle + crosshair painted into the frame pixmap
+        self._overlay_geom_key = None
+        self._overlay_r = 40.0
+        self._dot_xy: Optional[Tuple[float, float]] = None
+
+        # Last errors shown in the panels (arcmin); the overlay arrows reuse them
+        self._last_arcmin_x = 0.0
+        self._last_arcmin_y = 0.0
+        self._last_total = 0.0
+
+        # Last text pushed to each label (see _set_text)
+        self._label_texts = {}
+
+        # Last confirmed Polaris centroid; survives tracking loss (only _reset clears it)
+        self._last_good_seed: Optional[Tuple[float, float]] = None
 
         self._bus = _get_frame_bus()
 
@@ -387,6 +661,22 @@ class PolarAlignmentPage(QWidget):
         self._build_ui()
         self._wire()
 
+        # Polaris search runs on a worker thread; _solve_epoch invalidates in-flight results
+        self._solve_epoch = 0
+        self._last_solve_ms = 0.0
+        self._last_frame_sig = None  # fingerprint of the last frame sent to the solver
+        self._solver_thread = QThread(self)
+        self._solver = _SolverWorker()
+        self._solver.moveToThread(self._solver_thread)
+        self._solver.solved.connect(self._on_solved, Qt.QueuedConnection)
+        self._solver_thread.start()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_solver)
+
+        # payload unwrapper, picked from the first frame the bus delivers
+        self._extract = None
+
         # If bus exists, connect once
         if self._bus is not None and hasattr(self._bus, "frame_ready"):
             # Prevent double connections when recreating widget
@@ -396,12 +686,15 @@ class PolarAlignmentPage(QWidget):
                 pass
             self._bus.frame_ready.connect(self.on_new_frame)  # type: ignore
 
-        # overlay refresh timer (keeps stable UI even if frames come slower)
+        # overlay heartbeat: frames (bus / demo) and user actions drive the overlay
+        # directly, so this only catches leftovers + the waiting message
         self.ui_timer = QTimer(self)
         self.ui_timer.timeout.connect(self._tick_ui)
-        self.ui_timer.start(100)  # 10 fps for UI overlay
+        self.ui_timer.start(500)
 
-        # demo timer
+        # demo timer (+ its RNG and clock)
+        self._demo_rng = np.random.default_rng()
+        self._demo_t0 = time.time()  # demo clock origin: keeps trig arguments small
         self.demo_timer = QTimer(self)
         self.demo_timer.timeout.connect(self._demo_step)
 
@@ -467,10 +760,28 @@ class PolarAlignmentPage(QWidget):
         # CENTER: Live view + overlay scene
         self.view = QGraphicsView()
         self.view.setRenderHints(self.view.renderHints())
+        # Overlay is axis-aligned lines + small shapes: no shape AA (text AA stays on)
+        self.view.setRenderHint(QPainter.Antialiasing, False)
         self.view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.view.setStyleSheet("background:#0b0d10; border: 1px solid #23262d; border-radius:12px;")
+        self.view.setCacheMode(QGraphicsView.CacheBackground)
+        self.view.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.view.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing
+        )
+
+        # GPU-composited viewport when OpenGL is available; default raster viewport otherwise
+        if QOpenGLWidget is not None:
+            try:
+                self.view.setViewport(QOpenGLWidget())
+                # GL viewports repaint whole frames anyway; partial updates only add bookkeeping
+                self.view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+            except Exception:
+                pass
 
         self.scene = QGraphicsScene(self)
+        # ~8 items: a BSP index costs more to maintain than a linear scan
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.view.setScene(self.scene)
 
         # Frame pixmap
@@ -520,6 +831,10 @@ class PolarAlignmentPage(QWidget):
         self.top_hint.setFont(f)
         self.scene.addItem(self.top_hint)
 
+        # Static overlay items: blit from a device-space cache instead of re-rasterizing
+        for item in (self.target_circle, self.cross_h, self.cross_v, self.top_hint):
+            item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
         # RIGHT PANEL placeholder (NINA has sequences etc.)
         self.right_panel = self._card()
         self.right_panel.setFixedWidth(320)
@@ -606,17 +921,27 @@ class PolarAlignmentPage(QWidget):
             self.state.arcsec_per_px = float(txt)
         except Exception:
             self.state.arcsec_per_px = 2.0
+        self._arcmin_per_px = self.state.arcsec_per_px / 60.0
+        self._overlay_dirty = True
 
     # ─────────────────────────
     # Status / actions
     # ─────────────────────────
+    def _set_text(self, lbl: QLabel, txt: str):
+        # QLabel.setText re-layouts even for identical strings -> skip repeats
+        if self._label_texts.get(lbl) != txt:
+            self._label_texts[lbl] = txt
+            lbl.setText(txt)
+
     def _set_status(self, txt: str):
-        self.lbl_status.setText(txt)
+        self._set_text(self.lbl_status, txt)
 
     def _set_overlay_visible(self, vis: bool):
-        self.target_circle.setVisible(vis)
-        self.cross_h.setVisible(vis)
-        self.cross_v.setVisible(vis)
+        # circle + crosshair are painted into the frame pixmap while baked
+        static_vis = vis and not self._overlay_baked
+        self.target_circle.setVisible(static_vis)
+        self.cross_h.setVisible(static_vis)
+        self.cross_v.setVisible(static_vis)
         self.polaris_dot.setVisible(vis)
         self.az_arrow.setVisible(vis)
         self.alt_arrow.setVisible(vis)
@@ -646,6 +971,8 @@ class PolarAlignmentPage(QWidget):
         if self._semi_live:
             # Start/restart calibration cleanly
             self.cal.reset()
+            self._last_frame_sig = None
+            self._update_overlay()  # hide arrows now, not on the next heartbeat
             self._set_status("Semi-en vivo activo: calibración 3-point automática…")
         else:
             self._set_status("Semi-en vivo pausado.")
@@ -657,10 +984,17 @@ class PolarAlignmentPage(QWidget):
             return
         self._solve_frame(self._last_frame, force=True)
 
+    def _stop_solver(self):
+        self._solver_thread.quit()
+        self._solver_thread.wait()
+
     def _reset(self):
+        self._solve_epoch += 1
         self.state.polaris = None
         self.state.polaris_s = None
+        self._last_good_seed = None
         self.cal.reset()  # ✅ reset calibration too (added)
+        self._last_frame_sig = None
         self._set_status("Reiniciado. Esperando Live View…")
         self._update_errors(0.0, 0.0)
         self._update_overlay()
@@ -672,65 +1006,200 @@ class PolarAlignmentPage(QWidget):
         """
         FrameBus may emit:
           - numpy array
+          - dict {frame:..., ts:...}
           - list or bytes (older versions)
-        We support numpy arrays. If it's bytes, ignore.
+        We support numpy arrays (bare or in a dict). If it's bytes, ignore.
         """
         try:
             if frame is None:
                 return
 
-            if isinstance(frame, np.ndarray):
-                self._last_frame = frame
-                self._render_frame(frame)
-                if getattr(self, "_semi_live", False):
-                    self._solve_frame(frame, force=False)
-                else:
-                    # still update overlay geometry to keep centered
-                    self._update_overlay()
+            extract = self._extract
+            if extract is None:
+                extract = self._extract = _payload_extractor(frame)
+                if extract is None:
+                    return  # unsupported payload (bytes, list, ...)
+            try:
+                arr = extract(frame)
+            except (KeyError, TypeError):
+                arr = None
+            if not isinstance(arr, np.ndarray):
+                self._extract = None  # payload type changed: detect again next frame
                 return
 
-            # Some implementations emit dict {frame:..., ts:...}
-            if isinstance(frame, dict) and "frame" in frame and isinstance(frame["frame"], np.ndarray):
-                self._last_frame = frame["frame"]
-                self._render_frame(frame["frame"])
-                if getattr(self, "_semi_live", False):
-                    self._solve_frame(frame["frame"], force=False)
-                else:
-                    self._update_overlay()
-                return
+            self._last_frame = arr
+            self._render_frame(arr)
+            if self._semi_live:
+                self._solve_frame(arr, force=False)
+            elif self._overlay_dirty:
+                # still update overlay geometry to keep centered
+                self._update_overlay()
 
         except Exception as e:
             self._set_status(f"Error procesando frame: {e}")
 
-    def _render_frame(self, frame: np.ndarray):
-        qimg = _qimage_from_ndarray(frame)
-        if qimg.isNull():
-            return
+    def _prepare(self, frame: np.ndarray) -> _FramePrep:
+        """
+        Converts a frame ONCE into everything render/solve need:
+          - gray for the solver (mono: view, no copy; color: luminance)
+          - uint8 display image (downscaled to the viewport if much larger,
+            min/max normalized into reused buffers)
+        """
+        self._frame_gen += 1
 
-        pix = QPixmap.fromImage(qimg)
-        self.frame_item.setPixmap(pix)
+        gray = _to_gray(frame)
+
+        disp = self._display_downscale(frame)
+        if disp.dtype != np.uint8 and disp.size:
+            lo, hi = _min_max(disp)
+            # 16-bit mono that already spans most of the range: Qt shows it
+            # natively (Grayscale16), a stretch would barely change it
+            if not (disp.dtype == np.uint16 and disp.ndim == 2 and hi - lo >= 0x8000):
+                self._u8_buf = _reuse_buf(self._u8_buf, disp.shape, np.uint8)
+                disp = self._u8_buf = _to_uint8(disp, out=self._u8_buf, lohi=(lo, hi))
+
+        return _FramePrep(src=frame, qimg=self._to_qimage(disp), gray=gray, gen=self._frame_gen)
+
+    def _display_downscale(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Display-only: when the frame has >4x the viewport's pixels, resize it
+        (INTER_AREA) before it becomes a pixmap. The solver keeps the full-res frame.
+        """
+        vw, vh = self._viewport_px
+        h, w = frame.shape[:2]
+        if vw <= 0 or vh <= 0 or w * h <= 4 * vw * vh or frame.dtype not in _RESIZE_DTYPES:
+            return frame
+        f = min(vw / w, vh / h)
+        return cv2.resize(frame, (max(1, int(w * f)), max(1, int(h * f))), interpolation=cv2.INTER_AREA)
+
+    def _to_qimage(self, arr: np.ndarray) -> QImage:
+        """
+        Wraps a uint8 (or uint16 mono) frame in a QImage WITHOUT QImage.copy().
+        Contiguous frames (mono / RGB / RGBA) are wrapped directly (zero copy):
+        get_frame() returns a fresh array per call that the backend never touches again
+        (BaseCameraManager contract), so the frame itself is a stable buffer ->
+        callers must NOT mutate it until the next frame is prepared.
+        Non-contiguous frames are copied once into a page-owned buffer.
+        The buffer (_qimg_owner) and _last_qimage stay alive until the next frame;
+        a QImage over a page-owned buffer is built once and reused while that
+        buffer keeps its shape.
+        """
+        if arr.dtype == np.uint16 and arr.ndim == 2:
+            fmt = QImage.Format_Grayscale16
+        elif arr.dtype != np.uint8:
+            return QImage()
+        elif arr.ndim == 2:
+            fmt = QImage.Format_Grayscale8
+        elif arr.ndim == 3 and arr.shape[2] == 3:
+            fmt = QImage.Format_RGB888
+        elif arr.ndim == 3 and arr.shape[2] == 4:
+            fmt = QImage.Format_RGBA8888
+        else:
+            return QImage()
+
+        # (normalized / downscaled frames are contiguous page-owned buffers too)
+        if not arr.flags.c_contiguous:
+            self._display_buf = _reuse_buf(self._display_buf, arr.shape, arr.dtype)
+            np.copyto(self._display_buf, arr)
+            arr = self._display_buf
 
-        w = pix.width()
-        h = pix.height()
+        if arr is self._qimg_owner and self._last_qimage is not None:
+            return self._last_qimage  # same persistent buffer, new pixels already in place
 
-        # Scene rect = image rect
-        self.scene.setSceneRect(QRectF(0, 0, w, h))
+        h, w = arr.shape[:2]
+        self._qimg_owner = arr
+        self._last_qimage = QImage(arr.data, w, h, arr.strides[0], fmt)
+        return self._last_qimage
 
+    def _prep_for(self, frame: np.ndarray) -> _FramePrep:
+        prep = self._prep
+        if prep is None or prep.src is not frame:
+            prep = self._prep = self._prepare(frame)
+        return prep
+
+    def _fit_view(self):
         # Fit view while preserving aspect
         self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        vp = self.view.viewport()
+        dpr = vp.devicePixelRatioF()
+        self._viewport_px = (int(vp.width() * dpr), int(vp.height() * dpr))
+        if self._fit_size is not None:
+            self._fit_view()
+
+    def _render_frame(self, frame: np.ndarray):
+        prep = self._prep_for(frame)
+        if prep.gen == self._last_rendered_gen:
+            return  # this frame is already on screen (no pixmap conversion / upload)
+        qimg = prep.qimg
+        if qimg.isNull():
+            return
+        self._last_rendered_gen = prep.gen
+
+        # Scene rect = image rect; re-fit only when the frame size changes
+        # (widget resizes are handled in resizeEvent)
+        h, w = frame.shape[:2]
+        if (w, h) != self._fit_size:
+            self._fit_size = (w, h)
+            self.scene.setSceneRect(QRectF(0, 0, w, h))
+            self._fit_view()
+            self._overlay_dirty = True
+
         # Default center (image center). This will be replaced after 3-point calibration.
         if not self.cal.s.calibrated or self.cal.s.center is None:
-            self.state.center = (w / 2.0, h / 2.0)
+            center = (w / 2.0, h / 2.0)
+        else:
+            center = self.cal.s.center
+        if center != self.state.center:
+            self.state.center = center
+            self._overlay_dirty = True
+
+        # Calibrated live view: the target no longer moves -> paint it into the frame
+        # (one pixmap upload instead of 3 extra items). Demo / calibrating keep the items.
+        self._overlay_baked = self.cal.s.calibrated and not self.demo_timer.isActive()
+        if self._overlay_baked:
+            if qimg.isGrayscale():
+                qimg = qimg.convertToFormat(QImage.Format_RGB32)  # colored pens on a gray frame
+            pix = QPixmap.fromImage(qimg)
+            self._bake_static_overlay(pix, w, h)
         else:
-            self.state.center = self.cal.s.center
+            pix = QPixmap.fromImage(qimg)
+        self.frame_item.setPixmap(pix)
+
+        # Scene stays in full-res image coordinates; a downscaled pixmap is stretched back
+        self.frame_item.setScale(w / pix.width())
 
         self._set_overlay_visible(True)
 
         # Move the top hint
         self.top_hint.setPos(14, 10)
 
-        self._update_overlay()
+        # new pixels alone don't move the overlay: only re-layout after a change
+        if self._overlay_dirty:
+            self._update_overlay()
+
+    def _bake_static_overlay(self, pix: QPixmap, w: int, h: int):
+        """
+        Paints target circle + crosshair into the frame pixmap (scene coordinates),
+        matching the QGraphicsItems they replace:
+          - circle: 2 scene px pen
+          - crosshair: 1 screen px (the item pen is cosmetic)
+        """
+        cx, cy = self.state.center
+        r, L = _target_geom(w, h)
+        screen_px = 1.0 / max(self.view.transform().m11(), 1e-6)  # scene units per screen px
+
+        p = QPainter(pix)
+        p.scale(pix.width() / w, pix.height() / h)
+        p.setPen(QPen(QColor("#d050ff"), 2))
+        p.setBrush(Qt.NoBrush)
+        p.drawEllipse(QRectF(cx - r, cy - r, 2 * r, 2 * r))
+        p.setPen(QPen(QColor("#cfd6dd"), screen_px))
+        p.drawLine(QLineF(cx - L, cy, cx + L, cy))
+        p.drawLine(QLineF(cx, cy - L, cx, cy + L))
+        p.end()
 
     # ─────────────────────────
     # Solver (Polaris tracking) + 3-point calibration (added)
@@ -746,13 +1215,25 @@ class PolarAlignmentPage(QWidget):
             - after calibration: RA axis center computed from 3 points
         """
         now = time.time()
-        if not force and (now - self.state.last_t) < 0.10:
-            return  # throttle
+        # throttle to the measured solver cost (+20%), never faster than ~33 Hz
+        min_interval = max(0.030, self._last_solve_ms * 1.2 / 1000.0)
+        if not force and (now - self.state.last_t) < min_interval:
+            return
+        sig = _frame_sig(frame)
+        if not force and sig == self._last_frame_sig:
+            return  # duplicate frame from the bus: nothing new to solve
+        self._last_frame_sig = sig
         self.state.last_t = now
 
-        # Determine seed (stabilize)
-        seed = self.state.polaris_s if self.state.polaris_s is not None else self.state.polaris
-        p = _centroid_brightest(frame, seed=seed, search_radius=140 if seed else 999999)
+        # Candidate seeds: smoothed / raw Polaris, last confirmed position, target center
+        seeds = (self.state.polaris_s, self.state.polaris, self._last_good_seed, self.state.center)
+        self._solver.submit(self._prep_for(frame).gray, seeds, now, self._solve_epoch)
+
+    def _on_solved(self, p: Optional[Tuple[float, float]], now: float, epoch: int, solve_ms: float):
+        # GUI thread: apply a worker result to state / overlay / panels
+        self._last_solve_ms = solve_ms
+        if epoch != self._solve_epoch:
+            return  # result predates a reset
 
         if p is None:
             self._set_status("No se detecta Polaris (insuficientes estrellas / señal).")
@@ -763,6 +1244,7 @@ class PolarAlignmentPage(QWidget):
             return
 
         self.state.polaris = p
+        self._last_good_seed = p  # only accepted detections get here (p is None otherwise)
 
         # Smooth
         if self.state.polaris_s is None:
@@ -788,23 +1270,26 @@ class PolarAlignmentPage(QWidget):
         dy = cy - py
 
         # Convert to arcmin (rough)
-        arcmin_x = (dx * self.state.arcsec_per_px) / 60.0
-        arcmin_y = (dy * self.state.arcsec_per_px) / 60.0
+        k = self._arcmin_per_px
+        arcmin_x = dx * k
+        arcmin_y = dy * k
 
         self._update_errors(arcmin_x, arcmin_y)
         self._update_overlay()
 
         # info panel
         dist_px = _dist((cx, cy), (px, py))
-        dist_arcmin = (dist_px * self.state.arcsec_per_px) / 60.0
+        dist_arcmin = dist_px * k
 
-        cal_state = "OK" if (self.cal.s.calibrated and self.cal.s.center is not None) else f"{len(self.cal.s.points)}/3"
-        self.lbl_info.setText(
+        cal_state = "OK" if (self.cal.s.calibrated and self.cal.s.center is not None) else f"{self.cal.s.n_points}/3"
+        self._set_text(
+            self.lbl_info,
             f"Live View: OK\n"
             f"Polaris: x={px:.1f}, y={py:.1f}\n"
             f"Distancia al objetivo: {dist_arcmin:.2f}′\n"
             f"Escala: {self.state.arcsec_per_px:.2f} arcsec/px\n"
             f"Calibración (3-point): {cal_state}\n"
+            f"Solver: {solve_ms:.1f} ms\n"
         )
 
         # Status text (keeps your old behavior but adds calibration status)
@@ -828,44 +1313,54 @@ class PolarAlignmentPage(QWidget):
         rect = self.scene.sceneRect()
         if rect.isNull():
             return
+        self._overlay_dirty = False
 
         cx, cy = self.state.center
         w = rect.width()
         h = rect.height()
 
-        # Target circle radius: 18% of smaller dimension (NINA-ish)
-        r = max(40.0, min(w, h) * 0.18)
-        self.target_circle.setRect(QRectF(cx - r, cy - r, 2 * r, 2 * r))
+        # Target circle + crosshair only depend on scene size and center
+        geom_key = (w, h, cx, cy)
+        if geom_key != self._overlay_geom_key:
+            self._overlay_geom_key = geom_key
+
+            r, L = _target_geom(w, h)
+            _set_rect_if_changed(self.target_circle, QRectF(cx - r, cy - r, 2 * r, 2 * r))
+            self._overlay_r = r
 
-        # Crosshair length
-        L = max(80.0, min(w, h) * 0.22)
-        self.cross_h.setLine(cx - L, cy, cx + L, cy)
-        self.cross_v.setLine(cx, cy - L, cx, cy + L)
+            _set_line_if_changed(self.cross_h, cx - L, cy, cx + L, cy)
+            _set_line_if_changed(self.cross_v, cx, cy - L, cx, cy + L)
+        r = self._overlay_r
 
         # Polaris dot
         if self.state.polaris_s is not None:
             px, py = self.state.polaris_s
-            dot_r = 6.0
-            self.polaris_dot.setRect(QRectF(px - dot_r, py - dot_r, 2 * dot_r, 2 * dot_r))
+            last = self._dot_xy
+            # sub-0.5 px moves are invisible at fit-in-view zoom: skip the scene invalidation
+            if last is None or abs(px - last[0]) >= 0.5 or abs(py - last[1]) >= 0.5:
+                self._dot_xy = (px, py)
+                dot_r = 6.0
+                self.polaris_dot.setRect(QRectF(px - dot_r, py - dot_r, 2 * dot_r, 2 * dot_r))
             self.polaris_dot.setVisible(True)
         else:
             self.polaris_dot.setVisible(False)
 
         # Arrows (derived from last errors stored)
-        ax = getattr(self, "_last_arcmin_x", 0.0)
-        ay = getattr(self, "_last_arcmin_y", 0.0)
+        ax = self._last_arcmin_x
+        ay = self._last_arcmin_y
 
         # Map arcmin -> pixels for arrows (visual only)
         scale_px = 25.0  # px per arcmin, for UI
-        vx = _clamp(ax * scale_px, -120, 120)
-        vy = _clamp(ay * scale_px, -120, 120)
+        # (snapped to 0.5 px so jitter below that doesn't move the arrow items)
+        vx = round(_clamp(ax * scale_px, -120, 120) * 2.0) / 2.0
+        vy = round(_clamp(ay * scale_px, -120, 120) * 2.0) / 2.0
 
         # Azimuth arrow is horizontal (cyan), Altitude vertical (yellow)
-        self.az_arrow.setLine(cx, cy + r + 18, cx - vx, cy + r + 18)
-        self.alt_arrow.setLine(cx + r + 18, cy, cx + r + 18, cy - vy)
+        _set_line_if_changed(self.az_arrow, cx, cy + r + 18, cx - vx, cy + r + 18)
+        _set_line_if_changed(self.alt_arrow, cx + r + 18, cy, cx + r + 18, cy - vy)
 
         # Hide arrows if almost aligned OR not calibrated yet (optional but NINA-like)
-        total = math.hypot(ax, ay)
+        total = self._last_total  # same value the Total panel shows
         if self.cal.s.calibrated:
             show = total >= 0.25
         else:
@@ -880,48 +1375,51 @@ class PolarAlignmentPage(QWidget):
     # ─────────────────────────
     @staticmethod
     def _fmt_arcmin(v: float) -> str:
-        # Show like 00° 05′ 22″ style? We'll approximate:
-        sign = "-" if v < 0 else ""
-        v = abs(v)
-        deg = int(v // 60.0)
-        rem_min = v - deg * 60.0
-        minute = int(rem_min)
-        sec = int((rem_min - minute) * 60.0)
-        return f"{sign}{deg:02d}° {minute:02d}′ {sec:02d}″"
+        # quantize to the 0.01′ display resolution so the memo table stays small
+        return _fmt_arcmin_centi(round(v * 100.0))
 
     def _update_errors(self, arcmin_x: float, arcmin_y: float):
-        self._last_arcmin_x = float(arcmin_x)
-        self._last_arcmin_y = float(arcmin_y)
+        # 0.01′ resolution: sub-display jitter must not change the panel text
+        arcmin_x = round(arcmin_x, 2)
+        arcmin_y = round(arcmin_y, 2)
 
-        # Total
-        total = math.hypot(arcmin_x, arcmin_y)
+        self._last_arcmin_x = arcmin_x
+        self._last_arcmin_y = arcmin_y
+        self._overlay_dirty = True
+
+        # Total (computed once here; _update_overlay reuses it for arrow visibility)
+        total = self._last_total = math.hypot(arcmin_x, arcmin_y)
 
         # Text like NINA
         az_dir = "Move left/west ←" if arcmin_x > 0 else ("Move right/east →" if arcmin_x < 0 else "—")
         alt_dir = "Move up ↑" if arcmin_y > 0 else ("Move down ↓" if arcmin_y < 0 else "—")
 
-        self.az_box["big"].setText(self._fmt_arcmin(arcmin_x))
-        self.az_box["hint"].setText(az_dir)
-        self.az_box["small"].setText(f"{abs(arcmin_x):.2f}′")
+        self._set_text(self.az_box["big"], self._fmt_arcmin(arcmin_x))
+        self._set_text(self.az_box["hint"], az_dir)
+        self._set_text(self.az_box["small"], f"{abs(arcmin_x):.2f}′")
 
-        self.alt_box["big"].setText(self._fmt_arcmin(arcmin_y))
-        self.alt_box["hint"].setText(alt_dir)
-        self.alt_box["small"].setText(f"{abs(arcmin_y):.2f}′")
+        self._set_text(self.alt_box["big"], self._fmt_arcmin(arcmin_y))
+        self._set_text(self.alt_box["hint"], alt_dir)
+        self._set_text(self.alt_box["small"], f"{abs(arcmin_y):.2f}′")
 
-        self.total_box["big"].setText(self._fmt_arcmin(total))
-        self.total_box["hint"].setText("—" if total < 0.25 else "Total Error")
-        self.total_box["small"].setText(f"{total:.2f}′")
+        self._set_text(self.total_box["big"], self._fmt_arcmin(total))
+        self._set_text(self.total_box["hint"], "—" if total < 0.25 else "Total Error")
+        self._set_text(self.total_box["small"], f"{total:.2f}′")
 
     # ─────────────────────────
     # Timers
     # ─────────────────────────
     def _tick_ui(self):
-        # Keep overlay aligned to view; this is cheap and prevents "drift"
-        self._update_overlay()
+        # Keep overlay aligned to view, but only re-layout after something changed
+        # (plus a forced pass every ~5 s as a safety net for missed invalidations)
+        self._ui_ticks += 1
+        if self._overlay_dirty or self._ui_ticks % 10 == 0:
+            self._update_overlay()
 
         # If no frames and no demo, keep the waiting message
+        # (frames seconds apart are normal with long exposures: not a stall)
         if self._last_frame is None and not self.demo_timer.isActive():
-            self.lbl_info.setText("Live View: —\nPolaris: —\n")
+            self._set_text(self.lbl_info, "Live View: —\nPolaris: —\n")
 
     # ─────────────────────────
     # Demo frames (Polaris-like)
@@ -929,27 +1427,28 @@ class PolarAlignmentPage(QWidget):
     def _demo_step(self):
         # Create a star field with a bright Polaris that slightly jitters
         w, h = 1280, 720
-        img = np.random.normal(10, 6, (h, w)).astype(np.float32)
-        img = np.clip(img, 0, 255)
+        rng = self._demo_rng
+        # uint8 end to end: background noise drawn straight into a fresh frame
+        # (uniform 0..20 ~ mean 10, sigma 6; fresh because the solver thread may
+        # still be reading the previous one)
+        img = rng.integers(0, 21, size=(h, w), dtype=np.uint8)
 
         # fixed "true" polaris near center but not exact
         cx, cy = w / 2, h / 2
-        t = time.time()
+        t = time.time() - self._demo_t0
 
         # ✅ Demo now also simulates RA movement (so 3-point can actually complete)
         # We make Polaris move on an arc around a hidden center to mimic RA rotation.
         hidden_cx = cx + 40
         hidden_cy = cy - 20
         radius = 90
-        ang = (t * 0.55) % (2 * math.pi)
-        px = hidden_cx + math.cos(ang) * radius + math.sin(t * 0.8) * 2.0
-        py = hidden_cy + math.sin(ang) * radius + math.cos(t * 0.7) * 2.0
+        # cos + sin of the arc angle from one complex exp
+        arc = cmath.exp(1j * (t * 0.55)) * radius
+        px = hidden_cx + arc.real + math.sin(t * 0.8) * 2.0
+        py = hidden_cy + arc.imag + math.cos(t * 0.7) * 2.0
 
-        # draw some stars
-        for _ in range(180):
-            sx = np.random.randint(0, w)
-            sy = np.random.randint(0, h)
-            img[sy, sx] = 255
+        # draw some stars (one draw of flat indices into the contiguous frame)
+        img.reshape(-1)[rng.integers(0, h * w, 180)] = 255
 
         # draw polaris as a small gaussian blob
         rr = 7
@@ -957,12 +1456,14 @@ class PolarAlignmentPage(QWidget):
         x1 = int(_clamp(px + rr, 0, w - 1))
         y0 = int(_clamp(py - rr, 0, h - 1))
         y1 = int(_clamp(py + rr, 0, h - 1))
-        for yy in range(y0, y1 + 1):
-            for xx in range(x0, x1 + 1):
-                d2 = (xx - px) ** 2 + (yy - py) ** 2
-                img[yy, xx] += 220 * math.exp(-d2 / (2 * 2.2 ** 2))
-
-        img = np.clip(img, 0, 255).astype(np.uint8)
+        # separable PSF: exp(-(dx²+dy²)/2σ²) = gx(dx) * gy(dy) -> 2 short exps + outer product
+        xs = _arange_f32(x1 - x0 + 1) + np.float32(x0 - px)
+        ys = _arange_f32(y1 - y0 + 1) + np.float32(y0 - py)
+        gx = np.exp(xs * xs * _DEMO_PSF_K)
+        gy = np.exp(ys * ys * _DEMO_PSF_K) * 220.0
+        # blob added in a small float32 temp, saturated back into the uint8 patch
+        patch = img[y0 : y1 + 1, x0 : x1 + 1]
+        np.clip(patch + gy[:, None] * gx, 0, 255, out=patch, casting="unsafe")
 
         self._last_frame = img
         self._render_frame(img)
@@ -972,5 +1473,5 @@ class PolarAlignmentPage(QWidget):
             self._semi_live = True
             self.btn_semi_live.setText("⏸ Pausar semi-en vivo")
             self._solve_frame(img, force=False)
-        else:
+        elif self._overlay_dirty:
             self._update_overlay()
\ No newline at end of file
@@ -1,6 +1,20 @@
+from math import copysign
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 
 
+# (axis, sign) -> arrow; sign 0 = no error on that axis
+_ARROWS = {
+    ("ALT", 1): "↑", ("ALT", -1): "↓", ("ALT", 0): "·",
+    ("AZ", 1): "→", ("AZ", -1): "←", ("AZ", 0): "·",
+}
+
+
+def _fmt_axis(axis: str, v: float) -> str:
+    key = (axis, 0 if abs(v) < 1e-9 else int(copysign(1, v)))
+    return f"{axis}: {_ARROWS[key]} {abs(v):.2f}′"
+
+
 class PolarInstructions(QWidget):
     def __init__(self):
         super().__init__()
@@ -24,14 +38,8 @@ class PolarInstructions(QWidget):
         layout.addWidget(self.quality_label)
 
     def update_values(self, error_az, error_alt):
-        def fmt(v, axis):
-            sign = "↑" if v > 0 and axis == "ALT" else \
-                   "↓" if v < 0 and axis == "ALT" else \
-                   "→" if v > 0 else "←"
-            return f"{axis}: {sign} {abs(v):.2f}′"
-
-        self.alt_label.setText(fmt(error_alt, "ALT"))
-        self.az_label.setText(fmt(error_az, "AZ"))
+        self.alt_label.setText(_fmt_axis("ALT", error_alt))
+        self.az_label.setText(_fmt_axis("AZ", error_az))
 
         quality = max(0, 100 - (abs(error_alt) + abs(error_az)) * 5)
         self.quality_label.setText(f"Calidad: {int(quality)} %")
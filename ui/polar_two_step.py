@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
+
+import cv2
 import numpy as np
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QThread, QCoreApplication, QTimer
 from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
@@ -16,13 +19,18 @@ from ui.overlay_live_view import OverlayLiveView
 
 
 def np_to_qimage_gray(img: np.ndarray) -> QImage:
+    # zero-copy: the QImage aliases img, so img must outlive it
     h, w = img.shape
-    return QImage(img.data, w, h, w, QImage.Format_Grayscale8).copy()
+    return QImage(img.data, w, h, w, QImage.Format_Grayscale8)
 
 
 def thumb_pix(img: QImage):
-    return QPixmap.fromImage(img).scaled(
-        220, 140, Qt.KeepAspectRatio, Qt.SmoothTransformation
+    # Scale the QImage before the pixmap upload; big frames get a cheap
+    # nearest pre-shrink to 2x the thumb, so the smooth pass stays small
+    if img.width() > 440 or img.height() > 280:
+        img = img.scaled(440, 280, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return QPixmap.fromImage(
+        img.scaled(220, 140, Qt.KeepAspectRatio, Qt.SmoothTransformation)
     )
 
 
@@ -35,6 +43,66 @@ def error_color(arcsec: float) -> str:
     return "#e74c3c"
 
 
+class _PreviewWorker(QObject):
+    """
+    Grabs and downsizes preview frames off the GUI thread.
+    request() is a single-slot mailbox: a slow camera drops ticks instead of
+    queueing them. Only numpy arrays cross back via `ready`; the GUI hands
+    each one back through recycle() once it shows a newer one, so the
+    preview runs on a couple of persistent buffers instead of one per frame.
+    """
+    ready = Signal(object, int)  # fit-size gray frame (C-contiguous), source width
+    _kick = Signal()
+
+    def __init__(self, cam):
+        super().__init__()
+        self.cam = cam
+        self._lock = threading.Lock()
+        self._pending = None
+        self._last_src = None  # last camera frame shown (held, so identity is safe)
+        self._free: list[np.ndarray] = []  # buffers no longer on screen (guarded by _lock)
+        self._kick.connect(self._process)
+
+    def request(self, w: int, h: int):
+        with self._lock:
+            was_empty = self._pending is None
+            self._pending = (w, h)
+        if was_empty:
+            self._kick.emit()
+
+    def recycle(self, buf: np.ndarray):
+        with self._lock:
+            self._free.append(buf)
+
+    @Slot()
+    def _process(self):
+        with self._lock:
+            job, self._pending = self._pending, None
+        if job is None or not self.cam.is_connected():
+            return
+
+        frame = self.cam.get_frame()
+        if frame is None or frame is self._last_src:
+            return  # no new frame from the camera
+        self._last_src = frame
+
+        # Frames bigger than the live view are area-downscaled to its fit size
+        # here instead of being scaled by Qt
+        w, h = job
+        fh, fw = frame.shape[:2]
+        scale = min(w / fw, h / fh)
+        shape = (max(1, int(fh * scale)), max(1, int(fw * scale))) if scale < 1.0 else frame.shape
+        with self._lock:
+            out = self._free.pop() if self._free else None
+        if out is None or out.shape != shape or out.dtype != frame.dtype:
+            out = np.empty(shape, dtype=frame.dtype)  # first frame / size change
+        if scale < 1.0:
+            cv2.resize(frame, (shape[1], shape[0]), dst=out, interpolation=cv2.INTER_AREA)
+        else:
+            np.copyto(out, frame)
+        self.ready.emit(out, fw)
+
+
 class PolarTwoStepPage(QWidget):
     def __init__(self, cam_manager: CameraManager):
         super().__init__()
@@ -42,6 +110,15 @@ class PolarTwoStepPage(QWidget):
 
         self.frame1 = None
         self.frame2 = None
+        self._thumb1: QPixmap | None = None  # built once per capture
+        self._thumb2: QPixmap | None = None
+        # Last solve, keyed by the frame pair it ran on (held here, so identity is safe):
+        # the profile only feeds the px -> alt/az conversion, so re-calculating with a
+        # different profile reuses the star matching
+        self._solved: tuple | None = None  # (frame1, frame2, SolverResult)
+
+        # Live preview pixels: the QImage handed to the live view aliases this buffer
+        self._preview_buf: np.ndarray | None = None
 
         storage = JsonProfileStorage("equipment/profiles.json")
         self.profiles = storage.load_profiles()
@@ -152,30 +229,68 @@ class PolarTwoStepPage(QWidget):
         root.addLayout(controls)
 
         # ── Timer ─────────────────────────────
+        # (runs only while the page is shown: see showEvent / hideEvent)
         self.timer = QTimer(self)
+        self.timer.setInterval(200)
         self.timer.timeout.connect(self.refresh)
-        self.timer.start(200)
+
+        # Frame grab + downscale run on a worker thread; the GUI only wraps the result
+        self._preview_thread = QThread(self)
+        self._preview = _PreviewWorker(self.cam)
+        self._preview.moveToThread(self._preview_thread)
+        self._preview.ready.connect(self._on_preview, Qt.QueuedConnection)
+        self._preview_thread.start()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_preview)
 
     # ─────────────────────────────────────────
+    def showEvent(self, e):
+        super().showEvent(e)
+        self.timer.start()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self.timer.stop()
+
     def refresh(self):
-        if self.cam.is_connected():
-            self.live.set_image(np_to_qimage_gray(self.cam.get_frame()))
+        # Nothing to show on a hidden / fully covered page: skip the whole preview pipeline
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
+        self._preview.request(self.live.width(), self.live.height())
+
+    def _on_preview(self, img: np.ndarray, src_w: int):
+        # The QImage is only a header over img (no pixel copy); a new one per frame
+        # keeps the live view's scaled-pixmap cache key honest
+        old, self._preview_buf = self._preview_buf, img  # keeps the pixels alive while shown
+        self.live.set_image(np_to_qimage_gray(img), src_w=src_w)
+        if old is not None:
+            self._preview.recycle(old)  # no longer referenced by the live view
+
+    def _stop_preview(self):
+        self._preview_thread.quit()
+        self._preview_thread.wait()
 
     def capture1(self):
         self.frame1 = self.cam.get_frame().copy()
-        self.cap1_box.setPixmap(thumb_pix(np_to_qimage_gray(self.frame1)))
+        self._thumb1 = thumb_pix(np_to_qimage_gray(self.frame1))
+        self.cap1_box.setPixmap(self._thumb1)
         self.b2.setEnabled(True)
 
     def capture2(self):
         self.frame2 = self.cam.get_frame().copy()
-        self.cap2_box.setPixmap(thumb_pix(np_to_qimage_gray(self.frame2)))
+        self._thumb2 = thumb_pix(np_to_qimage_gray(self.frame2))
+        self.cap2_box.setPixmap(self._thumb2)
         self.bc.setEnabled(True)
 
     def calculate(self):
         if self.frame1 is None or self.frame2 is None:
             return
 
-        res = solve_polar_two_step(self.frame1, self.frame2)
+        sv = self._solved
+        if sv is None or sv[0] is not self.frame1 or sv[1] is not self.frame2:
+            sv = self._solved = (self.frame1, self.frame2, solve_polar_two_step(self.frame1, self.frame2))
+        res = sv[2]
         if not res.ok:
             return
 
@@ -200,6 +315,9 @@ class PolarTwoStepPage(QWidget):
     def reset(self):
         self.frame1 = None
         self.frame2 = None
+        self._thumb1 = None
+        self._thumb2 = None
+        self._solved = None
         self.cap1_box.clear()
         self.cap2_box.clear()
         self.live.clear_overlay()
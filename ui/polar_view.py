@@ -1,3 +1,4 @@
+import numpy as np
 from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import QPainter, QPen, QColor
 from PySide6.QtCore import Qt, QPointF
@@ -10,14 +11,19 @@ class PolarView(QWidget):
 
         self.sensor_center = None
         self.polar_center = None
+        self._pts = None  # (2, 2) float32: [sensor, polar] in image px
 
     def set_centers(self, sensor_center, polar_center):
         self.sensor_center = sensor_center
         self.polar_center = polar_center
+        if sensor_center is None or polar_center is None:
+            self._pts = None
+        else:
+            self._pts = np.array([sensor_center, polar_center], dtype=np.float32)
         self.update()
 
     def paintEvent(self, event):
-        if not self.sensor_center or not self.polar_center:
+        if self._pts is None:
             return
 
         painter = QPainter(self)
@@ -25,13 +31,12 @@ class PolarView(QWidget):
 
         # Escalado simple (imagen → widget)
         w, h = self.width(), self.height()
-        sx, sy = w / 640, h / 480  # por ahora fijo (luego dinámico)
+        scale = np.array([w / 640, h / 480], dtype=np.float32)  # por ahora fijo (luego dinámico)
 
-        def map_point(p):
-            return QPointF(p[0] * sx, p[1] * sy)
-
-        sc = map_point(self.sensor_center)
-        pc = map_point(self.polar_center)
+        # all points mapped in one op; QPointF only at the draw boundary
+        (sx, sy), (px, py) = (self._pts * scale).tolist()
+        sc = QPointF(sx, sy)
+        pc = QPointF(px, py)
 
         # Centro del sensor (azul)
         painter.setPen(QPen(QColor("#4fa3ff"), 2))
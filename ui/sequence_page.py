@@ -8,15 +8,16 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 import numpy as np
-import cv2
 
-from PySide6.QtCore import Qt, QObject, Signal, QThread
+from PySide6.QtCore import Qt, QObject, Signal, QThread, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame, QGroupBox, QGridLayout,
@@ -25,6 +26,7 @@ from PySide6.QtWidgets import (
 )
 
 from ui.live_view_panel import LiveViewPanel
+from utils.avi_writer import AVIStreamWriter
 
 
 # ─────────────────────────────────────────────
@@ -45,36 +47,6 @@ def _timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
-def _to_bgr(frame: np.ndarray) -> np.ndarray:
-    if frame.ndim == 2:
-        return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-    if frame.ndim == 3 and frame.shape[2] == 3:
-        return frame
-    if frame.ndim == 3 and frame.shape[2] == 4:
-        return frame[:, :, :3]
-    g = frame.astype(np.uint8)
-    return cv2.cvtColor(g, cv2.COLOR_GRAY2BGR)
-
-
-def save_avi_mjpg(frames: List[np.ndarray], path: str, fps: float):
-    if not frames:
-        raise RuntimeError("No se capturaron frames (lista vacía).")
-
-    fps = float(max(1.0, fps))
-    h, w = frames[0].shape[:2]
-
-    fourcc = cv2.VideoWriter_fourcc(*"MJPG")
-    writer = cv2.VideoWriter(path, fourcc, fps, (w, h), True)
-    if not writer.isOpened():
-        raise RuntimeError("No se pudo abrir el writer AVI (MJPG).")
-
-    try:
-        for f in frames:
-            writer.write(_to_bgr(f))
-    finally:
-        writer.release()
-
-
 def save_fits(frame: np.ndarray, path: str):
     try:
         from astropy.io import fits  # type: ignore
@@ -85,7 +57,14 @@ def save_fits(frame: np.ndarray, path: str):
     if data.ndim == 3:
         data = data[:, :, 0]
 
-    hdu = fits.PrimaryHDU(data.astype(np.uint16) if data.dtype != np.uint16 else data)
+    # Widened, not rescaled: uint8 0..255 stays 0..255 in the uint16 image.
+    # uint16 frames go through untouched (only made contiguous if a channel slice)
+    if data.dtype == np.uint16:
+        data16 = np.ascontiguousarray(data)
+    else:
+        data16 = data.astype(np.uint16, copy=False)
+
+    hdu = fits.PrimaryHDU(data16)
     hdul = fits.HDUList([hdu])
     hdul.writeto(path, overwrite=True)
 
@@ -118,30 +97,36 @@ class SequenceWorker(QObject):
         super().__init__()
         self.cam = cam
         self.cfg = cfg
-        self._abort = False
+        self._abort = threading.Event()  # set from the GUI thread, polled / waited on here
         self._saved_state: Dict[str, Any] = {}
 
     def request_abort(self):
-        self._abort = True
+        self._abort.set()
 
     def run(self):
+        # FITS writes go to a background writer so disk I/O of capture i
+        # overlaps the exposure of capture i+1 (AVI already encodes while capturing)
+        writer = ThreadPoolExecutor(max_workers=1)
+        pending: List[Future] = []
         try:
             self.progress.emit("Preparando cámara…")
             self._save_camera_state()
             self._apply_capture_state()
 
             outputs: List[str] = []
+            ts = _timestamp()  # one per run; files are told apart by their index
 
             for i in range(1, self.cfg.n_caps + 1):
-                if self._abort:
+                if self._abort.is_set():
                     self.progress.emit("Secuencia detenida por el usuario.")
                     break
 
                 if self.cfg.cap_type == "FITS":
                     self.progress.emit(f"Capturando FITS {i}/{self.cfg.n_caps}…")
                     frame = self._capture_single_frame()
-                    out = os.path.join(self.cfg.out_dir, f"{self.cfg.base_name}_{_timestamp()}_{i:03d}.fits")
-                    save_fits(frame, out)
+                    out = os.path.join(self.cfg.out_dir, f"{self.cfg.base_name}_{ts}_{i:03d}.fits")
+                    # no copy: capture() returns a fresh array per call that the backend never touches again
+                    pending.append(writer.submit(save_fits, frame, out))
                     outputs.append(out)
 
                 elif self.cfg.cap_type == "AVI":
@@ -149,9 +134,12 @@ class SequenceWorker(QObject):
                     if dur <= 0:
                         raise RuntimeError("Duración inválida para AVI.")
                     self.progress.emit(f"Grabando AVI {i}/{self.cfg.n_caps} ({dur:.1f}s)…")
-                    frames, fps_real = self._capture_video(dur, self.cfg.fps)
-                    out = os.path.join(self.cfg.out_dir, f"{self.cfg.base_name}_{_timestamp()}_{i:03d}.avi")
-                    save_avi_mjpg(frames, out, fps_real)
+                    out = os.path.join(self.cfg.out_dir, f"{self.cfg.base_name}_{ts}_{i:03d}.avi")
+                    n, fps_real, dropped = self._capture_video(dur, self.cfg.fps, out)
+                    msg = f"AVI {i}/{self.cfg.n_caps}: {n} frames ({fps_real:.1f} fps reales)"
+                    if dropped:
+                        msg += f", {dropped} descartados"
+                    self.progress.emit(msg)
                     outputs.append(out)
 
                 elif self.cfg.cap_type == "SER":
@@ -163,6 +151,11 @@ class SequenceWorker(QObject):
             self.progress.emit("Restaurando cámara…")
             self._restore_camera_state()
 
+            if pending:
+                self.progress.emit("Guardando archivos…")
+            for fut in pending:
+                fut.result()  # re-raises a failed save
+
             self.finished.emit(outputs)
 
         except Exception as e:
@@ -171,6 +164,8 @@ class SequenceWorker(QObject):
             except Exception:
                 pass
             self.error.emit(str(e))
+        finally:
+            writer.shutdown(wait=True)
 
     def _save_camera_state(self):
         self._saved_state["exposure_ms"] = None
@@ -188,7 +183,7 @@ class SequenceWorker(QObject):
         _safe_call(self.cam, "start_live")
 
         for _ in range(2):
-            if self._abort:
+            if self._abort.is_set():
                 return
             _ = self._get_frame_safe()
             time.sleep(0.02)
@@ -215,32 +210,60 @@ class SequenceWorker(QObject):
         time.sleep(float(self.cfg.exposure_s))
         return self._get_frame_safe()
 
-    def _capture_video(self, duration_s: float, target_fps: float) -> tuple[List[np.ndarray], float]:
+    def _capture_video(self, duration_s: float, target_fps: float, path: str) -> tuple[int, float, int]:
+        """
+        Records an MJPG AVI straight to `path` while capturing:
+          - capture loop (this thread) only grabs frames -> AVIStreamWriter
+          - its encoder thread opens the writer on the first frame (its size)
+            at the target fps and encodes as frames arrive
+        Memory stays bounded for any duration (small pool of reused slots).
+        If the encoder falls behind and its queue is full, the frame is
+        dropped rather than delaying the next capture; the header then gets
+        the measured rate instead of the target one.
+        Returns (frames written, measured fps, frames dropped).
+        """
         duration_s = float(max(0.05, duration_s))
         target_fps = float(max(1.0, target_fps))
-        dt = 1.0 / target_fps
+        dt_ns = int(1e9 / target_fps)
 
-        frames: List[np.ndarray] = []
-        t0 = time.time()
-        t_next = t0
+        avi = AVIStreamWriter(path, target_fps)
 
-        while not self._abort and (time.time() - t0) < duration_s:
-            now = time.time()
-            if now < t_next:
-                time.sleep(min(0.01, t_next - now))
-                continue
+        # Deadline pacing on the monotonic clock: one sleep per frame, no polling,
+        # and t_next advances by exact ns steps (no drift vs. wall-clock jumps)
+        t0_ns = time.monotonic_ns()
+        end_ns = t0_ns + int(duration_s * 1e9)
+        t_next_ns = t0_ns
 
-            f = self._get_frame_safe()
-            frames.append(f.copy())
-            t_next += dt
+        aborted = self._abort.is_set
+        now_ns = time.monotonic_ns
 
-        elapsed = max(1e-6, time.time() - t0)
-        fps_real = len(frames) / elapsed if frames else target_fps
+        try:
+            while not aborted() and not avi.failed:
+                delay_ns = t_next_ns - now_ns()
+                # waiting on the abort event: Stop cuts a long frame interval short
+                if delay_ns > 0 and self._abort.wait(delay_ns / 1e9):
+                    break
+                if now_ns() >= end_ns:
+                    break
 
-        if not frames:
+                # owned: get_frame() returns a fresh array per call that the backend never touches again
+                avi.write(self._get_frame_safe(), owned=True)
+                t_next_ns += dt_ns
+        except BaseException:
+            avi.close()
+            raise
+
+        elapsed = max(1e-6, (now_ns() - t0_ns) / 1e9)
+        count = avi.count
+        fps_real = count / elapsed if count else target_fps
+        # drops (or a camera slower than the target) leave fewer frames than
+        # target_fps * elapsed: the measured rate keeps playback real-time
+        avi.close(fps=fps_real if avi.dropped or fps_real < 0.95 * target_fps else None)
+
+        if count == 0:
             raise RuntimeError("No se capturaron frames durante la grabación.")
 
-        return frames, fps_real
+        return count, fps_real, avi.dropped
 
 
 # ─────────────────────────────────────────────
@@ -259,6 +282,12 @@ class SequencePage(QWidget):
         self._thread: Optional[QThread] = None
         self._worker: Optional[SequenceWorker] = None
 
+        # WB sliders: a drag fires many valueChanged; apply once per ~frame
+        self._wb_timer = QTimer(self)
+        self._wb_timer.setSingleShot(True)
+        self._wb_timer.setInterval(16)
+        self._wb_timer.timeout.connect(self._apply_wb)
+
         self._build_ui()
         self._wire_live()
         self._wire_ui()
@@ -463,9 +492,6 @@ class SequencePage(QWidget):
 
         self._on_type_changed(self.cb_type.currentText())
 
-        for lbl in self.findChildren(QLabel):
-            lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-
     def _card(self) -> QFrame:
         w = QFrame()
         w.setStyleSheet("background:#171a20; border:1px solid #23262d; border-radius:12px;")
@@ -500,6 +526,10 @@ class SequencePage(QWidget):
         self.sp_fps.setVisible(text == "AVI")
 
     def _on_wb_changed(self):
+        if not self._wb_timer.isActive():
+            self._wb_timer.start()
+
+    def _apply_wb(self):
         r = self.sl_wb_r.value() / 100.0
         g = self.sl_wb_g.value() / 100.0
         b = self.sl_wb_b.value() / 100.0
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import queue
+import struct
+import threading
+from typing import Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+
+# ─────────────────────────────────────────────
+# Conversión a BGR (lo que espera cv2.VideoWriter)
+# ─────────────────────────────────────────────
+def _to_bgr(frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    # out: reusable BGR buffer for mono / 4-channel frames (used when its shape/dtype match)
+    if frame.ndim == 2:
+        return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR, dst=out)
+    if frame.ndim == 3 and frame.shape[2] == 3:
+        return frame
+    if frame.ndim == 3 and frame.shape[2] == 4:
+        # contiguous alpha drop (a [:, :, :3] view gets copied by VideoWriter anyway)
+        return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR, dst=out)
+    g = frame.astype(np.uint8, copy=False)
+    return cv2.cvtColor(g, cv2.COLOR_GRAY2BGR, dst=out)
+
+
+# Specialized converters for the usual 8-bit layouts; same contract as _to_bgr
+def _gray8_to_bgr(frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR, dst=out)
+
+
+def _bgr_passthrough(frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    return frame
+
+
+def _bgra_to_bgr(frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR, dst=out)
+
+
+_BGR_CONVERTERS: Dict[tuple, Callable[..., np.ndarray]] = {
+    (2, 1, np.dtype(np.uint8)): _gray8_to_bgr,
+    (3, 3, np.dtype(np.uint8)): _bgr_passthrough,
+    (3, 4, np.dtype(np.uint8)): _bgra_to_bgr,
+}
+
+
+def _select_to_bgr(frame: np.ndarray) -> Callable[..., np.ndarray]:
+    # Picked once per stream from the first frame (layout doesn't change mid-capture).
+    # Converters return `frame` itself when no conversion is needed, else `out`
+    # (or a new buffer when `out` doesn't fit)
+    key = (frame.ndim, frame.shape[2] if frame.ndim == 3 else 1, frame.dtype)
+    return _BGR_CONVERTERS.get(key, _to_bgr)
+
+
+def _open_avi_writer(path: str, fps: float, w: int, h: int) -> cv2.VideoWriter:
+    fps = float(max(1.0, fps))
+    fourcc = cv2.VideoWriter_fourcc(*"MJPG")
+    # FFmpeg backend first (libjpeg-turbo MJPG); default backend if this build lacks it
+    writer = cv2.VideoWriter(path, cv2.CAP_FFMPEG, fourcc, fps, (w, h), True)
+    if not writer.isOpened():
+        writer = cv2.VideoWriter(path, fourcc, fps, (w, h), True)
+    if not writer.isOpened():
+        raise RuntimeError("No se pudo abrir el writer AVI (MJPG).")
+    return writer
+
+
+# ─────────────────────────────────────────────
+# Parche de la cadencia en la cabecera AVI
+# ─────────────────────────────────────────────
+_U32 = struct.Struct("<I")
+
+
+def _patch_avi_fps(path: str, fps: float):
+    """
+    Rewrites the frame rate of a finished AVI in place: avih.dwMicroSecPerFrame
+    and the video strh dwScale / dwRate. Both live in the hdrl LIST at the start
+    of the file (any backend), so only the first 64 KiB are searched.
+    """
+    with open(path, "r+b") as fp:
+        head = fp.read(64 * 1024)
+
+        i = head.find(b"avih")
+        if i < 0:
+            raise RuntimeError("AVI sin cabecera avih.")
+        fp.seek(i + 8)  # FOURCC + chunk size
+        fp.write(_U32.pack(int(round(1e6 / fps))))
+
+        i = head.find(b"strh")
+        while i >= 0 and head[i + 8:i + 12] != b"vids":  # fccType after FOURCC + size
+            i = head.find(b"strh", i + 4)
+        if i < 0:
+            raise RuntimeError("AVI sin stream de vídeo (strh).")
+        # FOURCC + size, then fccType, fccHandler, dwFlags, wPriority, wLanguage, dwInitialFrames
+        fp.seek(i + 8 + 20)
+        fp.write(_U32.pack(1000))                    # dwScale
+        fp.write(_U32.pack(int(round(fps * 1000))))  # dwRate: fps = rate / scale
+
+
+# ─────────────────────────────────────────────
+# Escritor AVI en streaming
+# ─────────────────────────────────────────────
+class AVIStreamWriter:
+    """
+    MJPG AVI encoded while capturing:
+      - write() (capture thread) only queues the frame (copied into a pooled
+        slot unless owned); a bounded queue keeps RAM at a few frames for any
+        duration
+      - an encoder thread opens the writer on the first frame (its size),
+        converts to BGR and encodes, handing each slot back for reuse
+    If the encoder falls behind and the queue is full, write() drops the frame
+    (counted in `dropped`) instead of blocking the capture.
+    """
+
+    def __init__(self, path: str, fps: float, max_queue: int = 8):
+        self.path = path
+        self.fps = float(max(1.0, fps))
+
+        self.count = 0    # frames queued for encoding
+        self.dropped = 0  # frames skipped because the queue was full
+
+        self._q: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._free: queue.Queue = queue.Queue()  # slots written by the encoder, ready for reuse
+        self._n_slots = 0  # allocated lazily from the first frames, up to max_queue + 2
+        self._errors: List[Exception] = []
+
+        self._thread = threading.Thread(target=self._encode, daemon=True)
+        self._thread.start()
+
+    @property
+    def failed(self) -> bool:
+        return bool(self._errors)
+
+    def write(self, frame: np.ndarray, owned: bool = False) -> bool:
+        """
+        Queues a frame; False if it was dropped (encoder behind or failed).
+        owned: the caller hands the array over and never mutates it afterwards
+        (e.g. a get_frame() result) -> queued as is, no copy.
+        """
+        q = self._q
+        if q.full() or self._errors:
+            # only the capture thread puts, so the queue can't fill up after the check
+            self.dropped += 1
+            return False
+
+        if owned:
+            q.put((frame, False))
+            self.count += 1
+            return True
+
+        # copy: the caller may reuse the array while the encoder still holds it
+        free = self._free
+        if free.empty() and self._n_slots < q.maxsize + 2:
+            slot = np.empty_like(frame)
+            self._n_slots += 1
+        else:
+            slot = free.get()
+            if slot.shape != frame.shape or slot.dtype != frame.dtype:
+                slot = np.empty_like(frame)
+        np.copyto(slot, frame)
+        q.put((slot, True))
+        self.count += 1
+        return True
+
+    def close(self, fps: Optional[float] = None):
+        """
+        Flushes the queue and finalizes the file (re-raises an encoder error).
+        fps: real frame rate, known only at the end (e.g. measured): written
+        into the header instead of the one the writer was opened with.
+        """
+        self._q.put(None)
+        self._thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+
+        if self.count and fps is not None and abs(fps - self.fps) > 1e-6:
+            _patch_avi_fps(self.path, fps)
+
+    def _encode(self):
+        # Encoder thread: drains the queue until the None sentinel, returning each
+        # pooled slot (owned frames are just released)
+        q, free = self._q, self._free
+        writer: Optional[cv2.VideoWriter] = None
+        bgr: Optional[np.ndarray] = None  # converted BGR buffer reused for every frame
+        to_bgr = _to_bgr
+        try:
+            while True:
+                item = q.get()
+                if item is None:
+                    return
+                f, pooled = item
+                if writer is None:
+                    h, w = f.shape[:2]
+                    writer = _open_avi_writer(self.path, self.fps, w, h)
+                    to_bgr = _select_to_bgr(f)
+                img = to_bgr(f, bgr)
+                if img is not f:
+                    bgr = img
+                writer.write(img)
+                if pooled:
+                    free.put(f)
+        except Exception as e:
+            self._errors.append(e)
+            # keep draining (and recycling) so the capture side never blocks
+            while True:
+                item = q.get()
+                if item is None:
+                    break
+                if item[1]:
+                    free.put(item[0])
+        finally:
+            if writer is not None:
+                writer.release()
@@ -13,6 +13,13 @@ SER_COLOR_BAYER_BGGR = 9
 SER_COLOR_BAYER_GRBG = 10
 SER_COLOR_BAYER_GBRG = 11
 
+# Formatos precompilados (header SER de 178 bytes y frame count parcheado al cerrar)
+# FileID, LuID, ColorID, LittleEndian, Width, Height, PixelDepth, FrameCount,
+# Observer, Instrument, Telescope, DateTime, DateTime_UTC
+_HDR = struct.Struct("<14s7i40s40s40sqq")
+_U32 = struct.Struct("<I")
+_FRAME_COUNT_OFFSET = 38  # 14 + 6 * 4
+
 
 class SERWriter:
     """
@@ -40,6 +47,7 @@ class SERWriter:
         observer: str = "astroapp",
         instrument: str = "Camera",
         telescope: str = "Telescope",
+        est_frames: int = 1024,
     ):
         self.path = path
         self.width = width
@@ -50,9 +58,12 @@ class SERWriter:
         self.fps = fps
 
         self.frame_count = 0
-        self.timestamps: list[int] = []
+        # SER trailer: one little-endian u64 per frame (grown x2 when full)
+        self.timestamps = np.empty(max(1, est_frames), dtype="<u8")
 
-        self._file = open(path, "wb")
+        self._u8: np.ndarray | None = None  # reusable 8-bit scratch for wider sources
+        # SER es escritura secuencial de frames grandes: buffer de 4 MiB
+        self._file = open(path, "wb", buffering=4 * 1024 * 1024)
 
         self._write_header(observer, instrument, telescope)
 
@@ -78,8 +89,7 @@ class SERWriter:
             }
             color_id = bayer_map.get(self.bayer_pattern, SER_COLOR_MONO)
 
-        header = struct.pack(
-            "<14sIIIIIIII40s40s40sQ",
+        header = _HDR.pack(
             b"LUCAM-RECORDER",      # File ID
             0,                     # LuID
             color_id,              # ColorID
@@ -87,13 +97,12 @@ class SERWriter:
             self.width,            # Image width
             self.height,           # Image height
             self.bit_depth,        # Pixel depth
-            int(self.fps * 1000),  # Frame rate (milli-FPS)
             0,                     # Frame count (se parchea al cerrar)
-            0,                     # Observer ID
             observer.encode("ascii", "ignore").ljust(40, b"\0"),
             instrument.encode("ascii", "ignore").ljust(40, b"\0"),
             telescope.encode("ascii", "ignore").ljust(40, b"\0"),
             0,                     # DateTime (no usado)
+            0,                     # DateTime UTC (no usado)
         )
 
         self._file.write(header)
@@ -111,18 +120,26 @@ class SERWriter:
         if frame is None:
             return
 
-        if frame.dtype != np.uint8:
-            frame = np.clip(frame, 0, 255).astype(np.uint8)
-
         # Si llega RGB por error, cogemos un canal (fallback seguro)
         if frame.ndim == 3:
             frame = frame[..., 0]
 
-        self._file.write(frame.tobytes())
+        if self.bit_depth > 8:
+            # 16-bit SER: raw little-endian samples, no downcast
+            frame = frame.astype("<u2", copy=False)
+        elif frame.dtype != np.uint8:
+            # clip + narrow in one pass into a reused buffer
+            if self._u8 is None or self._u8.shape != frame.shape:
+                self._u8 = np.empty(frame.shape, dtype=np.uint8)
+            frame = np.clip(frame, 0, 255, out=self._u8, casting="unsafe")
+
+        # contiguous frames go out straight from their buffer (no tobytes() copy)
+        self._file.write(np.ascontiguousarray(frame).data)
 
         # Timestamp SER (microsegundos desde epoch)
-        ts = int(time.time() * 1_000_000)
-        self.timestamps.append(ts)
+        if self.frame_count == len(self.timestamps):
+            self.timestamps = np.resize(self.timestamps, 2 * len(self.timestamps))
+        self.timestamps[self.frame_count] = time.time_ns() // 1000
 
         self.frame_count += 1
 
@@ -135,12 +152,11 @@ class SERWriter:
         Escribe timestamps y parchea el número de frames
         """
 
-        # Timestamps al final
-        for ts in self.timestamps:
-            self._file.write(struct.pack("<Q", ts))
+        # Timestamps al final (un solo write)
+        self._file.write(self.timestamps[:self.frame_count].data)
 
         # Parchear número de imágenes
-        self._file.seek(38)
-        self._file.write(struct.pack("<I", self.frame_count))
+        self._file.seek(_FRAME_COUNT_OFFSET)
+        self._file.write(_U32.pack(self.frame_count))
 
         self._file.close()
@@ -1,11 +1,27 @@
-import requests
+import time
+
+from weather.http import SESSION
+
+# Open-Meteo actualiza "current" cada 15 min como mucho: cache por sitio
+# (~1 km, coords redondeadas a 2 decimales) durante 10 min
+_TTL_S = 600.0
+_CACHE: dict[tuple[float, float], tuple[float, dict]] = {}
+
 
 def get_current_weather(lat, lon):
+    key = (round(lat, 2), round(lon, 2))
+    hit = _CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _TTL_S:
+        return hit[1]
+
     url = (
         "https://api.open-meteo.com/v1/forecast"
         f"?latitude={lat}&longitude={lon}"
         "&current=temperature_2m,cloud_cover,wind_speed_10m,relative_humidity_2m"
         "&timezone=auto"
     )
-    data = requests.get(url, timeout=10).json()
-    return data.get("current")
+    data = SESSION.get(url, timeout=10).json()
+    current = data.get("current")
+    if current is not None:
+        _CACHE[key] = (time.monotonic(), current)
+    return current
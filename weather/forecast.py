@@ -1,4 +1,12 @@
-import requests
+import time
+
+from weather.http import SESSION
+
+# El modelo horario de Open-Meteo no cambia en minutos: cache por sitio
+# (~1 km, coords redondeadas a 2 decimales) y nº de días durante 5 min
+_TTL_S = 300.0
+_CACHE: dict[tuple[float, float, int], tuple[float, dict]] = {}
+
 
 def get_astro_forecast(lat, lon, days=7):
     """
@@ -7,6 +15,11 @@ def get_astro_forecast(lat, lon, days=7):
     - utc_offset_seconds
     - hourly (time, cloud_cover, humidity, wind...)
     """
+    key = (round(lat, 2), round(lon, 2), int(days))
+    hit = _CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _TTL_S:
+        return hit[1]
+
     url = (
         "https://api.open-meteo.com/v1/forecast"
         f"?latitude={lat}&longitude={lon}"
@@ -14,4 +27,7 @@ def get_astro_forecast(lat, lon, days=7):
         f"&forecast_days={days}"
         "&timezone=auto"
     )
-    return requests.get(url, timeout=10).json()
+    data = SESSION.get(url, timeout=10).json()
+    if "hourly" in data:
+        _CACHE[key] = (time.monotonic(), data)
+    return data
@@ -0,0 +1,6 @@
+import requests
+
+# Una sola sesión para todas las llamadas a Open-Meteo: reutiliza la conexión
+# keep-alive (sin handshake TLS por petición). Las llamadas siguen siendo
+# síncronas: se hacen desde workers en QThread, nunca en el hilo de la UI.
+SESSION = requests.Session()
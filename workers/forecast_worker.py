@@ -1,3 +1,5 @@
+import traceback
+
 from workers.base_worker import BaseWorker
 
 from weather.forecast import get_astro_forecast
@@ -30,7 +32,6 @@ class ForecastWorker(BaseWorker):
             })
 
         except Exception as e:
-            import traceback
-            print(traceback.format_exec())
+            traceback.print_exc()
             self.error.emit(str(e))
             
@@ -1,6 +1,8 @@
 import time
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from typing import List
 
 import numpy as np
 from PySide6.QtCore import QObject, Signal
@@ -9,6 +11,30 @@ from utils.ser_writer import SERWriter   # 👈 lo creamos después
 import cv2
 
 
+# Bayer -> RGB (SER / preview order) and Bayer -> BGR (what cv2.VideoWriter wants)
+_BAYER_RGB = {
+    "RGGB": cv2.COLOR_BayerRG2RGB,
+    "BGGR": cv2.COLOR_BayerBG2RGB,
+    "GRBG": cv2.COLOR_BayerGR2RGB,
+    "GBRG": cv2.COLOR_BayerGB2RGB,
+}
+_BAYER_BGR = {
+    "RGGB": cv2.COLOR_BayerRG2BGR,
+    "BGGR": cv2.COLOR_BayerBG2BGR,
+    "GRBG": cv2.COLOR_BayerGR2BGR,
+    "GBRG": cv2.COLOR_BayerGB2BGR,
+}
+
+
+def _write_fits(path: str, frame: np.ndarray, exptime: float, gain):
+    from astropy.io import fits
+
+    hdu = fits.PrimaryHDU(frame)
+    hdu.header["EXPTIME"] = exptime
+    hdu.header["GAIN"] = gain
+    hdu.writeto(path, overwrite=True)
+
+
 class SequenceWorker(QObject):
     finished = Signal()
     error = Signal(str)
@@ -23,11 +49,36 @@ class SequenceWorker(QObject):
 
         self._saved_state = {}
 
+        # FITS files are written on a background thread (see run)
+        self._fits_writer: ThreadPoolExecutor | None = None
+        self._fits_pending: List[Future] = []
+
+        # WB gains are fixed for the run: one 256-entry table per channel (R, G, B)
+        ramp = np.arange(256, dtype=np.float32)
+        gains = (params.get("wb_r", 1.0), params.get("wb_g", 1.0), params.get("wb_b", 1.0))
+        self._wb_lut = np.clip(
+            np.stack([ramp * g for g in gains], axis=1), 0, 255
+        ).astype(np.uint8).reshape(1, 256, 3)
+        self._wb_lut_bgr = np.ascontiguousarray(self._wb_lut[:, :, ::-1])
+        # gains that map every 8-bit level to itself (1.0, or within rounding of it)
+        self._wb_identity = bool(np.all(self._wb_lut[0] == np.arange(256, dtype=np.uint8)[:, None]))
+
+        # Per-frame outputs of _debayer / _apply_white_balance, reused across frames
+        # (cv2 reallocates them itself if the frame size changes). Writers consume
+        # each frame synchronously, so nothing still holds the previous contents.
+        self._debayer_buf: np.ndarray | None = None
+        self._wb_buf: np.ndarray | None = None
+
     # ─────────────────────────────────────────────
     # Entry point
     # ─────────────────────────────────────────────
 
     def run(self):
+        # disk I/O of FITS capture i overlaps the exposure of capture i+1
+        self._fits_writer = ThreadPoolExecutor(max_workers=1)
+        self._fits_pending = []
+        # one timestamp per run; files are told apart by their capture index
+        self._run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         try:
             self._save_camera_state()
             self._apply_capture_settings()
@@ -35,6 +86,10 @@ class SequenceWorker(QObject):
             cap_type = self.params["type"]
             captures = self.params["captures"]
 
+            # short FITS exposures can finish many captures per second:
+            # emit progress at most every 100 ms (and always for the last one)
+            last_emit = 0.0
+
             for i in range(captures):
                 if not self._running:
                     break
@@ -46,14 +101,23 @@ class SequenceWorker(QObject):
                 elif cap_type == "FITS":
                     self._capture_fits(i + 1)
 
-                self.progress.emit(i + 1, captures)
+                now = time.monotonic()
+                if now - last_emit >= 0.1 or i + 1 == captures:
+                    self.progress.emit(i + 1, captures)
+                    last_emit = now
 
             self._restore_camera_state()
+
+            for fut in self._fits_pending:
+                fut.result()  # re-raises a failed write
+
             self.finished.emit()
 
         except Exception as e:
             self._restore_camera_state()
             self.error.emit(str(e))
+        finally:
+            self._fits_writer.shutdown(wait=True)
 
     def stop(self):
         self._running = False
@@ -105,8 +169,7 @@ class SequenceWorker(QObject):
         duration = self.params["duration_s"]
         out_dir = self.params["output_dir"]
 
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = os.path.join(out_dir, f"capture_{ts}_{index:03d}.ser")
+        path = os.path.join(out_dir, f"capture_{self._run_ts}_{index:03d}.ser")
 
         writer = None
 
@@ -148,8 +211,7 @@ class SequenceWorker(QObject):
         duration = self.params["duration_s"]
         out_dir = self.params["output_dir"]
 
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = os.path.join(out_dir, f"capture_{ts}_{index:03d}.avi")
+        path = os.path.join(out_dir, f"capture_{self._run_ts}_{index:03d}.avi")
 
         writer = None
         t0 = time.time()
@@ -166,9 +228,9 @@ class SequenceWorker(QObject):
                 writer = cv2.VideoWriter(path, fourcc, 1.0 / self.params["exposure_s"], (w, h), True)
 
             if self.params.get("color", False):
-                frame = self._debayer(frame)
-                frame = self._apply_white_balance(frame)
-                frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+                # debayer straight to BGR: no RGB2BGR pass afterwards
+                frame = self._debayer(frame, bgr=True)
+                frame = self._apply_white_balance(frame, bgr=True)
             else:
                 frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
 
@@ -182,44 +244,45 @@ class SequenceWorker(QObject):
     # ─────────────────────────────────────────────
 
     def _capture_fits(self, index: int):
-        from astropy.io import fits
-
         out_dir = self.params["output_dir"]
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        path = os.path.join(out_dir, f"capture_{ts}_{index:03d}.fits")
+        path = os.path.join(out_dir, f"capture_{self._run_ts}_{index:03d}.fits")
 
         frame = self.cam.capture(self.params["exposure_s"] * 1000.0)
 
         if frame is None:
             raise RuntimeError("Frame FITS vacío")
 
-        hdu = fits.PrimaryHDU(frame)
-        hdu.header["EXPTIME"] = self.params["exposure_s"]
-        hdu.header["GAIN"] = self.params["gain"]
-        hdu.writeto(path, overwrite=True)
+        # no copy: capture() returns a fresh array per call that the backend never touches again
+        self._fits_pending.append(self._fits_writer.submit(
+            _write_fits, path, frame, self.params["exposure_s"], self.params["gain"]
+        ))
 
-    def _debayer(self, frame: np.ndarray) -> np.ndarray:
+    def _debayer(self, frame: np.ndarray, bgr: bool = False) -> np.ndarray:
         pattern = self.params.get("bayer", "BGGR")
 
-        bayer_map = {
-            "RGGB": cv2.COLOR_BayerRG2RGB,
-            "BGGR": cv2.COLOR_BayerBG2RGB,
-            "GRBG": cv2.COLOR_BayerGR2RGB,
-            "GBRG": cv2.COLOR_BayerGB2RGB,
-        }
-
-        code = bayer_map.get(pattern)
+        code = (_BAYER_BGR if bgr else _BAYER_RGB).get(pattern)
         if code is None:
             raise RuntimeError(f"Patrón Bayer no soportado: {pattern}")
 
-        return cv2.cvtColor(frame, code)
+        self._debayer_buf = cv2.cvtColor(frame, code, dst=self._debayer_buf)
+        return self._debayer_buf
+
 
+    def _apply_white_balance(self, rgb: np.ndarray, bgr: bool = False) -> np.ndarray:
+        # bgr: channels come in B, G, R order
+        if rgb.dtype == np.uint8 and rgb.ndim == 3 and rgb.shape[2] == 3:
+            if self._wb_identity:
+                return rgb
+            # same values as the float path below (scale, clip, truncate), one pass
+            self._wb_buf = cv2.LUT(rgb, self._wb_lut_bgr if bgr else self._wb_lut, dst=self._wb_buf)
+            return self._wb_buf
 
-    def _apply_white_balance(self, rgb: np.ndarray) -> np.ndarray:
         r = self.params.get("wb_r", 1.0)
         g = self.params.get("wb_g", 1.0)
         b = self.params.get("wb_b", 1.0)
+        if bgr:
+            r, b = b, r
 
         out = rgb.astype(np.float32)
         out[:, :, 0] *= r